@@ -1,311 +1,2456 @@
-import streamlit as st
-import os
-import json
-import io
-import zipfile
-import re
-import time
-# 📌 Github 관련 모듈
-from github import Github, GithubException, UnknownObjectException
-from openai import OpenAI
-
-# --- 버전 정보 ---
-CURRENT_VERSION = "🚀 v14.0 (Final Fix: 프롬프트 복구 & 특수효과 적용)"
-
-# --- 1. 시크릿 로드 ---
-try:
-    GITHUB_TOKEN = st.secrets["general"]["github_token"]
-    REPO_NAME = st.secrets["general"]["repo_name"]
-    OPENAI_API_KEY = st.secrets["general"]["openai_api_key"]
-except Exception as e:
-    st.error(f"🚨 설정 오류: Secrets를 확인하세요. ({str(e)})")
-    st.stop()
-
-ADMIN_PASSWORD = "1234"
-UPLOAD_DIR = "resources"
-
-st.set_page_config(page_title="Red Drive", layout="wide", page_icon="🔴", initial_sidebar_state="expanded")
-
-# --- 2. CSS 디자인 ---
-st.markdown("""
-<style>
-    @import url('https://cdn.jsdelivr.net/gh/orioncactus/pretendard/dist/web/static/pretendard.css');
-    html, body, p, h1, h2, h3, h4, h5, h6, span, div, label, input, textarea, button {
-        font-family: Pretendard, sans-serif;
-    }
-    .stApp { background-color: #0E1117; color: #FAFAFA; }
-    .stDeployButton, header, div[data-testid="stStatusWidget"] { display: none !important; }
-    div[data-testid="stTooltipHoverTarget"] { display: none !important; }
-
-    section[data-testid="stSidebar"] {
-        background-color: #161B22;
-        border-right: 1px solid #30363D;
-    }
-    div[role="radiogroup"] label {
-        background-color: transparent; border: 1px solid transparent; border-radius: 6px;
-        padding: 12px 16px; margin: 0 !important; transition: all 0.2s ease;
-        color: #8b949e !important; font-weight: 600;
-    }
-    div[role="radiogroup"] label:hover { background-color: #21262D; color: white !important; }
-    div[role="radiogroup"] label[data-checked="true"] {
-        background-color: #E63946 !important; color: white !important;
-        box-shadow: 0 4px 12px rgba(230, 57, 70, 0.3); border: none;
-    }
-    .resource-card {
-        background-color: #1F242C; border: 1px solid #30363D; border-radius: 12px;
-        padding: 20px; height: 100%; display: flex; flex-direction: column; justify-content: space-between;
-        margin-bottom: 15px;
-    }
-    .resource-title { color: white; font-size: 1.2rem; font-weight: 700; margin: 10px 0 5px 0; }
-    .resource-preview { color: #B0B0B0; font-size: 0.9rem; margin-bottom: 15px; }
-</style>
-""", unsafe_allow_html=True)
-
-# --- 3. 헬퍼 함수 ---
-def clean_text_for_preview(text):
-    if not text: return "내용 없음"
-    clean = re.sub(r'[#*`\->]', '', text)
-    clean = " ".join(clean.split())
-    return clean[:120]
-
-def get_repo():
-    g = Github(GITHUB_TOKEN)
-    return g.get_repo(REPO_NAME)
-
-@st.cache_data(ttl=60)
-def load_resources_from_github():
-    resources = []
-    repo = get_repo()
-    try:
-        contents = repo.get_contents(UPLOAD_DIR)
-        for content in contents:
-            if content.type == "dir":
-                try:
-                    info_file = repo.get_contents(f"{content.path}/info.json")
-                    info_data = json.loads(info_file.decoded_content.decode("utf-8"))
-                    info_data['id'] = content.name
-                    info_data['path'] = content.path
-                    resources.append(info_data)
-                except: continue
-    except: return []
-    return sorted(resources, key=lambda x: x.get('title', ''), reverse=True)
-
-def safe_create_or_update(repo, file_path, message, content):
-    try:
-        existing_file = repo.get_contents(file_path)
-        repo.update_file(file_path, message, content, existing_file.sha)
-    except UnknownObjectException:
-        try:
-            repo.create_file(file_path, message, content)
-        except GithubException as e:
-            if e.status == 409:
-                st.error("🚨 보안 경고: 파일 안에 OpenAI Key 같은 비밀 정보가 포함되어 있어 GitHub가 업로드를 차단했습니다. 키를 지우고 다시 시도하세요.")
-            else:
-                st.error(f"❌ GitHub 오류 ({e.status}): {e.data}")
-            st.stop()
-    except GithubException as e:
-        st.error(f"❌ 알 수 없는 GitHub 오류: {str(e)}")
-        st.stop()
-
-def upload_to_github(folder_name, files, meta_data):
-    repo = get_repo()
-    base_path = f"{UPLOAD_DIR}/{folder_name}"
-    
-    progress_text = "파일 업로드 시작..."
-    my_bar = st.progress(0, text=progress_text)
-    
-    total_steps = len(files) + 1
-    
-    for idx, file in enumerate(files):
-        safe_filename = file.name 
-        file_path = f"{base_path}/{safe_filename}"
-        content_bytes = file.getvalue()
-        
-        safe_create_or_update(repo, file_path, f"Add {safe_filename}", content_bytes)
-        
-        percent = int(((idx + 1) / total_steps) * 100)
-        my_bar.progress(percent, text=f"Uploading: {safe_filename}")
-            
-    json_path = f"{base_path}/info.json"
-    json_content = json.dumps(meta_data, ensure_ascii=False, indent=4)
-    safe_create_or_update(repo, json_path, "Add info", json_content)
-    
-    my_bar.progress(100, text="업로드 완료!")
-    time.sleep(0.5)
-    my_bar.empty()
-
-def delete_from_github(folder_path):
-    repo = get_repo()
-    contents = repo.get_contents(folder_path)
-    for c in contents: repo.delete_file(c.path, "Del", c.sha)
-
-def download_zip(selected_objs):
-    repo = get_repo()
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        for res in selected_objs:
-            safe_folder_name = re.sub(r'[\\/:*?"<>|]', '_', res.get('title', 'Untitled'))
-            contents = repo.get_contents(res['path'])
-            for c in contents:
-                if c.name != "info.json":
-                    zip_path = f"{safe_folder_name}/{c.name}"
-                    zf.writestr(zip_path, c.decoded_content)
-    return zip_buffer.getvalue()
-
-# 📌 [복구 완료] 선생님이 주신 완벽한 프롬프트 적용
-def generate_desc(file_contents_str, hint):
-    if not OPENAI_API_KEY: return "API 키가 설정되지 않았습니다."
-    client = OpenAI(api_key=OPENAI_API_KEY)
-    
-    prompt = f"""
-    당신은 기업의 수석 IT 컨설턴트입니다. 
-    사용자가 업로드한 '파일의 실제 내용'을 분석하여 임원 및 실무자 보고용 문서를 작성하세요.
-    
-    [분석할 파일 내용]:
-    {file_contents_str}
-    
-    [작성자 힌트]: 
-    {hint}
-    
-    **작성 가이드:**
-    1. 서론(안녕하세요 등) 절대 금지. 바로 본론 진입.
-    2. 전문적인 비즈니스 용어 사용.
-    3. 화살표(->)를 사용하여 데이터 흐름을 명확히 표현.
-    4. 언어: 한국어 (Korean)
-    
-    **출력 포맷 (Markdown):**
-    
-    ### 📋 시스템 요약 (Executive Summary)
-    (이 도구가 무엇인지, 어떤 비즈니스 가치를 주는지 2줄 요약)
-
-    ### ⚙️ 아키텍처 및 데이터 흐름
-    * **Flow**: `[입력] -> [처리] -> [출력]` (실제 로직 반영)
-    * **핵심 구성 요소**:
-        * **파일명**: (해당 파일의 구체적 역할과 로직 설명)
-
-    ### 🛠️ 기술적 메커니즘 (Deep Dive)
-    * **트리거**: (언제 실행되는지)
-    * **로직**: (데이터가 어떻게 가공되는지 코드 레벨 분석)
-
-    ### ✨ 비즈니스 임팩트
-    (도입 시 정량적/정성적 기대 효과)
-    """
-    try:
-        res = client.chat.completions.create(model="gpt-4o", messages=[{"role":"user","content":prompt}])
-        return res.choices[0].message.content
-    except str as e: return f"오류 발생: {e}"
-
-# --- 5. 메인 화면 ---
-def main():
-    with st.sidebar:
-        st.title("🔴 Red Drive")
-        st.caption(CURRENT_VERSION)
-        st.write("---")
-        menu = st.radio("메뉴 이동", ["🗂️ 리소스 탐색", "⚙️ 관리자 모드"], label_visibility="collapsed")
-
-    if "탐색" in menu:
-        st.title("Red Drive | AI 리소스 센터")
-        
-        if 'resources' not in st.session_state:
-            with st.spinner("데이터 로딩 중..."):
-                st.session_state['resources'] = load_resources_from_github()
-        
-        resources = st.session_state['resources']
-        st.metric("총 리소스", f"{len(resources)}개")
-        st.divider()
-
-        c1, c2 = st.columns([5, 1])
-        search = c1.text_input("검색", placeholder="키워드...", label_visibility="collapsed")
-        if c2.button("🔄 새로고침"):
-            if 'resources' in st.session_state: del st.session_state['resources']
-            st.rerun()
-        if search: resources = [r for r in resources if search.lower() in str(r).lower()]
-        
-        if 'selected' not in st.session_state: st.session_state['selected'] = []
-
-        if not resources:
-            st.info("등록된 리소스가 없습니다.")
-        else:
-            cols = st.columns(2)
-            for idx, res in enumerate(resources):
-                with cols[idx % 2]:
-                    with st.container():
-                        st.markdown(f"""
-                        <div class="resource-card">
-                            <div style="font-weight:bold; color:#E63946;">{res.get('category')}</div>
-                            <div class="resource-title">{res.get('title')}</div>
-                            <div class="resource-preview">{clean_text_for_preview(res.get('description', ''))}...</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        c_chk, c_exp = st.columns([1, 2])
-                        is_sel = res['id'] in st.session_state['selected']
-                        if c_chk.checkbox("선택", key=res['id'], value=is_sel):
-                            if res['id'] not in st.session_state['selected']: st.session_state['selected'].append(res['id'])
-                        else:
-                            if res['id'] in st.session_state['selected']: st.session_state['selected'].remove(res['id'])
-                        with c_exp.expander("상세 보기"):
-                            st.markdown(res.get('description', ''))
-
-        if st.session_state['selected']:
-            st.markdown("---")
-            # 📌 다운로드 버튼 클릭 시 눈송이 효과
-            if st.button("📦 다운로드 (ZIP)", type="primary", use_container_width=True):
-                st.snow()  # ❄️ 눈송이 효과
-                
-                target = [r for r in resources if r['id'] in st.session_state['selected']]
-                with st.spinner("압축 중... 잠시만 기다려주세요 ❄️"):
-                    zip_data = download_zip(target)
-                    time.sleep(1) 
-                    st.download_button("💾 파일 저장하기 (Click)", zip_data, "RedDrive.zip", "application/zip", use_container_width=True)
-
-    elif "관리자" in menu:
-        st.title("⚙️ 관리자 모드")
-        pwd = st.text_input("비밀번호", type="password")
-        if pwd == ADMIN_PASSWORD:
-            t1, t2 = st.tabs(["신규 등록", "삭제"])
-            with t1:
-                with st.form("upl"):
-                    title = st.text_input("제목 (한글)")
-                    cat = st.selectbox("카테고리", ["Workflow", "Prompt", "Data", "Tool"])
-                    files = st.file_uploader("파일 업로드", accept_multiple_files=True)
-                    hint = st.text_area("AI 힌트")
-                    
-                    if st.form_submit_button("등록"):
-                        if title and files:
-                            with st.spinner("AI 분석 및 업로드 중..."):
-                                content_summary = ""
-                                for f in files:
-                                    try: content_summary += f.getvalue().decode("utf-8")[:1000]
-                                    except: content_summary += "Binary File"
-                                desc = generate_desc(content_summary, hint)
-                                meta = {"title":title, "category":cat, "description":desc, "files":[f.name for f in files]}
-                                
-                                safe_title = "".join(x for x in title if x.isalnum()) 
-                                folder_name = f"{safe_title}_{os.urandom(4).hex()}"
-                                
-                                upload_to_github(folder_name, files, meta)
-                            
-                            # 📌 업로드 성공 시 풍선 효과
-                            st.balloons() 
-                            st.success("등록이 완료되었습니다! 잠시 후 목록이 갱신됩니다.")
-                            time.sleep(3) 
-                            
-                            del st.session_state['resources']
-                            st.rerun()
-
-            with t2:
-                if st.button("목록 새로고침"): 
-                    st.session_state['resources'] = load_resources_from_github()
-                res_list = st.session_state.get('resources', [])
-                if res_list:
-                    target = st.selectbox("삭제 대상", [r['title'] for r in res_list])
-                    if st.button("영구 삭제", type="primary"):
-                        tgt = next(r for r in res_list if r['title'] == target)
-                        with st.spinner("삭제 중..."): delete_from_github(tgt['path'])
-                        st.success("삭제됨")
-                        del st.session_state['resources']
-                        st.rerun()
-
-if __name__ == "__main__":
-    main()
+import streamlit as st
+import os
+import json
+import zipfile
+import re
+import time
+import base64
+import hashlib
+import random
+import copy
+import struct
+import zlib
+import shutil
+import tempfile
+import threading
+import math
+import mmap
+import sqlite3
+import logging
+from contextlib import contextmanager
+from bisect import bisect_left
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import requests
+import numpy as np
+# 📌 Github 관련 모듈
+from github import Github, Auth, GithubException, UnknownObjectException, InputGitTreeElement
+from openai import OpenAI
+
+# --- 버전 정보 ---
+CURRENT_VERSION = "🚀 v14.0 (Final Fix: 프롬프트 복구 & 특수효과 적용)"
+
+# --- 1. 시크릿 로드 ---
+try:
+    STORAGE_BACKEND = st.secrets["general"].get("storage_backend", "github")  # "github" | "local"
+    MIRROR_TO_GITHUB = bool(st.secrets["general"].get("mirror_to_github", False))  # local 변경분을 GitHub 로 비동기 반영
+    NEEDS_GITHUB = STORAGE_BACKEND == "github" or MIRROR_TO_GITHUB
+    GITHUB_TOKEN = st.secrets["general"]["github_token"] if NEEDS_GITHUB else st.secrets["general"].get("github_token", "")
+    REPO_NAME = st.secrets["general"]["repo_name"] if NEEDS_GITHUB else st.secrets["general"].get("repo_name", "")
+    OPENAI_API_KEY = st.secrets["general"]["openai_api_key"]
+except Exception as e:
+    st.error(f"🚨 설정 오류: Secrets를 확인하세요. ({str(e)})")
+    st.stop()
+
+def get_setting(key, default=None):
+    # 선택 설정값: Secrets [general] 에 없으면 기본값 사용
+    try: return st.secrets["general"].get(key, default)
+    except Exception: return default
+
+ADMIN_PASSWORD = "1234"
+UPLOAD_DIR = "resources"
+MANIFEST_PATH = f"{UPLOAD_DIR}/index.json"  # 리소스별 요약 1줄씩 담은 카탈로그 매니페스트
+MANIFEST_FIELDS = ("title", "category", "preview", "files", "info_sha")
+SEARCH_TERMS_CHARS = 2000  # 카탈로그 항목 1개에 싣는 설명 검색어 최대 글자 수 (로컬 스냅샷/DB 에만 저장, 매니페스트에는 넣지 않음)
+CATEGORIES = ("Workflow", "Prompt", "Data", "Tool")
+GITHUB_WORKERS = 8  # info.json / blob 병렬 조회 스레드 수
+GITHUB_MAX_CONCURRENCY = int(get_setting("github_max_concurrency", 8))  # 프로세스 전체 동시 GitHub 요청 수
+GITHUB_MAX_RETRIES = 5
+RATE_LIMIT_RESERVE = 200  # 남은 한도가 이 아래로 내려가면 대량 작업은 리셋까지 대기
+GITHUB_API_URL = get_setting("github_api_url", "https://api.github.com")  # GitHub Enterprise / 로컬 대역 서버(tools/fake_github.py)용
+CACHE_DIR = get_setting("cache_dir", ".cache")
+CATALOG_REVALIDATE_SECONDS = 60  # 이 시간이 지나면 다음 조회 때 백그라운드 재검증
+CATALOG_CACHE_KEEP = 3  # 디스크에 남겨둘 커밋별 카탈로그 개수
+CATALOG_FORMAT = 2  # 카탈로그 항목 모양(resource_entry)을 바꾸면 올릴 것 -> 예전 디스크 스냅샷은 무시됨
+ZIP_SPOOL_BYTES = 32 * 1024 * 1024  # ZIP 결과물: 이 크기까지만 메모리, 넘으면 임시파일로 넘김
+BLOB_SPOOL_BYTES = 4 * 1024 * 1024  # 받아두는 blob 1개당 메모리 상한
+STREAM_CHUNK = 256 * 1024
+LARGE_FILE_BYTES = int(get_setting("large_file_bytes", 5 * 1024 * 1024))  # 이 크기 이상은 스트리밍 업로드 경로로
+BLOB_UPLOAD_CHUNK = 3 * 256 * 1024  # base64 로 끊김 없이 이어 붙이려면 3의 배수
+LARGE_UPLOAD_SLOTS = 2  # 동시에 스트리밍하는 대용량 파일 수 (메모리 상한 = 슬롯 x 청크 x ~2.3)
+DESC_FILE_BYTES = 256 * 1024  # AI 설명 생성에 넘기는 파일당 최대 바이트
+ZIP_CACHE_BYTES = 512 * 1024 * 1024  # 리소스별 ZIP 캐시 디스크 상한 (오래 안 쓴 것부터 삭제)
+PAGE_SIZES = (12, 24, 48, 96)  # 탐색 화면 한 페이지 카드 수 선택지 (URL ?size=)
+DEFAULT_PAGE_SIZE = 24
+SEARCH_FIELD_WEIGHTS = {"title": 5.0, "category": 3.0, "files": 2.0, "terms": 1.0}
+SEARCH_MODES = ("키워드", "의미", "혼합")
+EMBEDDING_PROVIDER = get_setting("embedding_provider", "openai")  # "openai" | "hashing"(결정적 로컬 모델, 테스트/오프라인용)
+EMBEDDING_MODEL = get_setting("embedding_model", "text-embedding-3-small")
+EMBED_HASH_DIM = 256
+EMBED_BATCH = 64  # 임베딩 요청 1회에 넣는 리소스 수
+EMBED_FLUSH_ROWS = 1024  # 백필 중 이만큼 모이면 디스크에 저장 (중간에 재시작해도 이어서)
+EMBED_TEXT_CHARS = 4000  # 임베딩에 넣는 설명 최대 글자 수
+EMBED_RETRY_SECONDS = 30  # 백필 실패 후 다시 시도하기까지 대기 (연속 실패마다 2배, 최대 EMBED_RETRY_MAX_SECONDS)
+EMBED_RETRY_MAX_SECONDS = 30 * 60
+SEMANTIC_TOP_K = 50
+HYBRID_ALPHA = 0.5  # 혼합 검색 점수 = alpha x 의미(코사인) + (1 - alpha) x 키워드(최고점 대비)
+COMPARE_FILES_LIMIT = 300  # compare API 가 돌려주는 최대 파일 수 (넘으면 전체 재로딩)
+OPENAI_MODEL = "gpt-4o"
+OPENAI_BASE_URL = get_setting("openai_base_url")  # 로컬 스텁 서버(tools/openai_stub.py) 등으로 바꿀 때만 설정
+PROMPT_VERSION = "v14"  # 프롬프트를 고치면 올릴 것 -> 설명 캐시가 자동으로 무효화됨
+DESC_CACHE_ENTRIES = 1000  # 디스크 설명 캐시 최대 항목 수 (오래 안 쓴 것부터 삭제)
+DESC_WORKERS = 2  # 동시에 돌릴 AI 설명 생성 작업 수
+DESC_TIMEOUT = 120  # OpenAI 호출 1회 타임아웃(초)
+DESC_RETRIES = 3
+DESC_INPUT_TOKENS = 12000  # 최종 프롬프트에 넣을 파일 내용 토큰 예산
+DESC_MAP_WORKERS = 4  # 예산 초과 시 파일별 요약(map)을 동시에 돌릴 개수
+DESC_MAP_FILE_TOKENS = 6000  # 파일별 요약에 넣을 최대 토큰
+DESC_MARKUP_BODY_TOKENS = 800  # 예산 초과 시 마크업/문서 본문을 코드보다 먼저 이 크기로 줄임
+DESC_MIN_SECTION_TOKENS = 60  # 마지막 자르기에서도 파일마다 남길 최소 토큰 (파일명/첫 줄)
+CODE_EXTENSIONS = (".gs", ".js", ".ts", ".py", ".java", ".kt", ".go", ".rb", ".php", ".cs", ".sh")
+CONFIG_EXTENSIONS = (".json", ".yml", ".yaml", ".toml", ".ini", ".cfg", ".conf", ".properties", ".env")
+MARKUP_EXTENSIONS = (".html", ".htm", ".xml", ".vue", ".svelte")
+DESC_PLACEHOLDER = "⏳ AI 설명을 생성하는 중입니다. 잠시 후 새로고침하면 반영됩니다."
+METRIC_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)  # 지연(초) 히스토그램 경계
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)  # 화면 1회당 GitHub 요청 수 히스토그램 경계
+METRIC_SAMPLES = 512  # 성능 탭 p50/p95 계산용으로 지표별로 남겨두는 최근 샘플 수
+METRICS_PREFIX = "red_drive_"
+METRICS_PORT = get_setting("metrics_port")  # 설정하면 이 포트의 /metrics 로 Prometheus 텍스트 형식 노출
+LOG_LEVEL = get_setting("log_level", "INFO")  # 구조화(JSON) 로그 수준, 호출마다 남기지 않으려면 "WARNING"
+LOCAL_STORAGE_DIR = get_setting("local_storage_dir", "storage")  # local 백엔드 루트 (resources/<id>/ 구조, 저장소 체크아웃 경로도 가능)
+LOCAL_DB_PATH = get_setting("local_db_path") or os.path.join(LOCAL_STORAGE_DIR, "catalog.sqlite3")
+MIRROR_RETRY_SECONDS = 30  # GitHub 미러링 실패 시 다음 시도까지 대기(초)
+WARM_INTERVAL_SECONDS = int(get_setting("warm_interval_seconds", 15))  # 캐시 워머가 HEAD 를 확인하는 주기(초), 0 이면 끔
+WARM_IDLE_SECONDS = 300  # 이 시간 동안 화면 실행이 없으면 워머가 멈춤 (다음 실행 때 다시 시작)
+WARM_TOP_RESOURCES = int(get_setting("warm_top_resources", 20))  # ZIP 캐시를 미리 채울 인기(다운로드 많은) 리소스 수
+
+st.set_page_config(page_title="Red Drive", layout="wide", page_icon="🔴", initial_sidebar_state="expanded")
+
+# --- 2. CSS 디자인 ---
+st.markdown("""
+<style>
+    @import url('https://cdn.jsdelivr.net/gh/orioncactus/pretendard/dist/web/static/pretendard.css');
+    html, body, p, h1, h2, h3, h4, h5, h6, span, div, label, input, textarea, button {
+        font-family: Pretendard, sans-serif;
+    }
+    .stApp { background-color: #0E1117; color: #FAFAFA; }
+    .stDeployButton, header, div[data-testid="stStatusWidget"] { display: none !important; }
+    div[data-testid="stTooltipHoverTarget"] { display: none !important; }
+
+    section[data-testid="stSidebar"] {
+        background-color: #161B22;
+        border-right: 1px solid #30363D;
+    }
+    div[role="radiogroup"] label {
+        background-color: transparent; border: 1px solid transparent; border-radius: 6px;
+        padding: 12px 16px; margin: 0 !important; transition: all 0.2s ease;
+        color: #8b949e !important; font-weight: 600;
+    }
+    div[role="radiogroup"] label:hover { background-color: #21262D; color: white !important; }
+    div[role="radiogroup"] label[data-checked="true"] {
+        background-color: #E63946 !important; color: white !important;
+        box-shadow: 0 4px 12px rgba(230, 57, 70, 0.3); border: none;
+    }
+    .resource-card {
+        background-color: #1F242C; border: 1px solid #30363D; border-radius: 12px;
+        padding: 20px; height: 100%; display: flex; flex-direction: column; justify-content: space-between;
+        margin-bottom: 15px;
+    }
+    .resource-title { color: white; font-size: 1.2rem; font-weight: 700; margin: 10px 0 5px 0; }
+    .resource-preview { color: #B0B0B0; font-size: 0.9rem; margin-bottom: 15px; }
+</style>
+""", unsafe_allow_html=True)
+
+# --- 3. 헬퍼 함수 ---
+def clean_text_for_preview(text):
+    if not text: return "내용 없음"
+    clean = re.sub(r'[#*`\->]', '', text)
+    clean = " ".join(clean.split())
+    return clean[:120]
+
+DESC_PLACEHOLDER_PREVIEW = clean_text_for_preview(DESC_PLACEHOLDER)  # 카탈로그 항목만으로 "설명 생성 대기" 리소스를 찾을 때 사용
+
+class Metrics:
+    # 📌 프로세스 전체 성능 지표 (카운터 / 게이지 / 히스토그램) + JSON 한 줄 로그
+    # 키는 (이름, 라벨 튜플), 히스토그램은 Prometheus 버킷 카운트와 최근 샘플(성능 탭 백분위용)을 같이 유지
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.counters = defaultdict(float)
+        self.gauges = {}
+        self.histograms = {}
+        self.logger = logging.getLogger("red_drive")
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self.logger.addHandler(handler)
+            self.logger.propagate = False
+        self.logger.setLevel(LOG_LEVEL)
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        with self.lock: self.counters[self._key(name, labels)] += value
+
+    def set_gauge(self, name, value, **labels):
+        with self.lock: self.gauges[self._key(name, labels)] = value
+
+    def observe(self, name, value, buckets=METRIC_BUCKETS, **labels):
+        key = self._key(name, labels)
+        with self.lock:
+            h = self.histograms.get(key)
+            if h is None:
+                h = self.histograms[key] = {"le": buckets, "counts": [0] * (len(buckets) + 1), "sum": 0.0, "recent": deque(maxlen=METRIC_SAMPLES)}
+            h["counts"][bisect_left(h["le"], value)] += 1  # 마지막 칸은 +Inf
+            h["sum"] += value
+            h["recent"].append(value)
+
+    def total(self, name):
+        with self.lock: return sum(v for (n, _), v in self.counters.items() if n == name)
+
+    def log(self, event, **fields):
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(json.dumps({"ts": round(time.time(), 3), "event": event, **fields}, ensure_ascii=False, default=str))
+
+    @contextmanager
+    def timer(self, name, **labels):
+        # with 블록 시간을 {name}_seconds 히스토그램 + {name}_total{status} 카운터 + 로그 1줄로 기록
+        started, status = time.perf_counter(), "ok"
+        try: yield
+        except Exception:
+            status = "error"
+            raise
+        except BaseException:
+            status = "interrupted"  # st.stop / st.rerun
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.observe(f"{name}_seconds", elapsed, **labels)
+            self.inc(f"{name}_total", status=status, **labels)
+            self.log(name, duration_ms=round(elapsed * 1000, 2), status=status, **labels)
+
+    def snapshot(self):
+        # 성능 탭용: 히스토그램별 건수 / 평균 / 최근 샘플 p50·p95·최대
+        with self.lock:
+            hists = {k: (h["counts"][:], h["sum"], sorted(h["recent"])) for k, h in self.histograms.items()}
+            counters, gauges = dict(self.counters), dict(self.gauges)
+        rows = []
+        for (name, labels), (counts, total, recent) in sorted(hists.items()):
+            n = sum(counts)
+            rows.append({"지표": name, "라벨": ", ".join(f"{k}={v}" for k, v in labels), "건수": n, "평균": total / n if n else 0.0,
+                         "p50": recent[len(recent) // 2] if recent else 0.0,
+                         "p95": recent[min(int(len(recent) * 0.95), len(recent) - 1)] if recent else 0.0,
+                         "최대": recent[-1] if recent else 0.0})
+        return rows, counters, gauges
+
+    def render_prometheus(self):
+        # Prometheus 텍스트 노출 형식 (0.0.4)
+        def fmt(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            if not pairs: return ""
+            esc = lambda v: str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+            return "{" + ",".join(f'{k}="{esc(v)}"' for k, v in pairs) + "}"
+        with self.lock:
+            counters, gauges = sorted(self.counters.items()), sorted(self.gauges.items())
+            hists = sorted((k, (h["le"], h["counts"][:], h["sum"])) for k, h in self.histograms.items())
+        lines, typed = [], set()
+        def declare(name, kind):
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} {kind}")
+        for (name, labels), value in counters:
+            declare(METRICS_PREFIX + name, "counter")
+            lines.append(f"{METRICS_PREFIX}{name}{fmt(labels)} {float(value)!r}")
+        for (name, labels), value in gauges:
+            declare(METRICS_PREFIX + name, "gauge")
+            lines.append(f"{METRICS_PREFIX}{name}{fmt(labels)} {float(value)!r}")
+        for (name, labels), (le, counts, total) in hists:
+            full = METRICS_PREFIX + name
+            declare(full, "histogram")
+            cumulative = 0
+            for bound, count in zip(list(le) + ["+Inf"], counts):
+                cumulative += count
+                lines.append(f"{full}_bucket{fmt(labels, [('le', bound if bound == '+Inf' else f'{bound:g}')])} {cumulative}")
+            lines.append(f"{full}_sum{fmt(labels)} {float(total)!r}")
+            lines.append(f"{full}_count{fmt(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+@st.cache_resource
+def get_metrics():
+    metrics = Metrics()
+    if METRICS_PORT: start_metrics_server(metrics, int(METRICS_PORT))
+    return metrics
+
+def start_metrics_server(metrics, port):
+    # 스크레이퍼용 GET /metrics (Streamlit 서버와 별도 포트, 데몬 스레드)
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, fmt, *args): pass
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics": return self.send_error(404)
+            body = metrics.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+    try: server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+    except OSError as e: return metrics.log("metrics_server_error", port=port, error=str(e))  # 다른 프로세스가 이미 사용 중
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+@contextmanager
+def track_rerun():
+    # 스크립트 1회 실행 시간 + 그동안 늘어난 GitHub 요청 수 (같은 시각의 다른 세션/백그라운드 요청도 섞이는 근사치)
+    metrics = get_metrics()
+    before = metrics.total("github_requests_total")
+    try:
+        with metrics.timer("script_rerun"): yield
+    finally:
+        metrics.observe("rerun_github_requests", metrics.total("github_requests_total") - before, buckets=COUNT_BUCKETS)
+
+class GitHubScheduler:
+    # 📌 프로세스 전체 GitHub 요청 스케줄러
+    # - 동시 요청 수 제한 (대량 작업은 1칸을 대화형 요청용으로 비워둠)
+    # - 대화형 요청이 기다리는 동안에는 대량 작업(blob 일괄 조회/생성)이 새로 시작하지 않음
+    # - 403/429/secondary rate limit 은 Retry-After / 리셋 시각 / 지터 섞인 지수 백오프로 재시도
+    INTERACTIVE, BULK = 0, 1
+
+    def __init__(self, limit):
+        self.limit = max(limit, 2)
+        self.cond = threading.Condition()
+        self.active = 0
+        self.waiting_interactive = 0
+        self.paused_until = 0.0
+        self.remaining = None
+        self.reset_at = 0.0
+
+    def _blocked(self, priority, now):
+        if now < self.paused_until or self.active >= self.limit: return True
+        if priority == self.INTERACTIVE: return False
+        if self.waiting_interactive or self.active >= self.limit - 1: return True
+        return self.remaining is not None and self.remaining < RATE_LIMIT_RESERVE and now < self.reset_at
+
+    def _acquire(self, priority):
+        with self.cond:
+            if priority == self.INTERACTIVE: self.waiting_interactive += 1
+            try:
+                while self._blocked(priority, time.time()):
+                    wake_at = max(self.paused_until, self.reset_at if priority == self.BULK else 0)
+                    self.cond.wait(timeout=min(max(wake_at - time.time(), 0.05), 5))
+                self.active += 1
+            finally:
+                if priority == self.INTERACTIVE: self.waiting_interactive -= 1
+
+    def _release(self):
+        with self.cond:
+            self.active -= 1
+            self.cond.notify_all()
+
+    def observe(self, headers):
+        # 응답 헤더의 X-RateLimit-* 를 기록
+        if not headers: return
+        headers = {k.lower(): v for k, v in headers.items()}
+        if "x-ratelimit-remaining" in headers:
+            with self.cond:
+                self.remaining = int(headers["x-ratelimit-remaining"])
+                self.reset_at = float(headers.get("x-ratelimit-reset", 0))
+            get_metrics().set_gauge("github_rate_limit_remaining", self.remaining)
+            get_metrics().set_gauge("github_rate_limit_reset_timestamp", self.reset_at)
+
+    def _retry_delay(self, status, headers, message, attempt):
+        # (대기 시간, 프로세스 전체 일시정지 여부) / 재시도 대상이 아니면 (None, False)
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        rate_limited = status == 429 or (status == 403 and ("rate limit" in message.lower() or headers.get("x-ratelimit-remaining") == "0"))
+        if rate_limited:
+            if "retry-after" in headers: return float(headers["retry-after"]), True
+            if headers.get("x-ratelimit-remaining") == "0":
+                return max(float(headers.get("x-ratelimit-reset", 0)) - time.time(), 1), True
+            return 1 + random.uniform(0, min(60, 2 ** attempt)), True  # secondary rate limit: 최소 1초 + 지터
+        if status in (500, 502, 503, 504):
+            return random.uniform(0, min(30, 2 ** attempt)), False
+        return None, False
+
+    def call(self, fn, *args, priority=INTERACTIVE, op=None, **kwargs):
+        # op: 지표/로그에 남길 호출 이름 (기본은 함수 이름, 예: get_git_tree)
+        metrics, op = get_metrics(), op or getattr(fn, "__name__", "call")
+        lane = "bulk" if priority == self.BULK else "interactive"
+        for attempt in range(GITHUB_MAX_RETRIES):
+            queued_at = time.perf_counter()
+            self._acquire(priority)
+            started, status = time.perf_counter(), "error"
+            metrics.observe("github_queue_wait_seconds", started - queued_at, priority=lane)
+            try:
+                result = fn(*args, **kwargs)
+                status = "ok"
+                self.observe(getattr(result, "raw_headers", None) or getattr(result, "headers", None))
+                return result
+            except GithubException as e:
+                error, status = e, e.status
+                delay, pause_all = self._retry_delay(e.status, e.headers, str(e.data), attempt)
+            except requests.HTTPError as e:
+                error, status = e, e.response.status_code
+                delay, pause_all = self._retry_delay(e.response.status_code, e.response.headers, e.response.text, attempt)
+            finally:
+                self._release()
+                elapsed = time.perf_counter() - started
+                metrics.observe("github_request_seconds", elapsed, op=op)
+                metrics.inc("github_requests_total", op=op, status=status)
+                metrics.log("github_request", op=op, priority=lane, status=status, attempt=attempt, duration_ms=round(elapsed * 1000, 2))
+            if delay is None or attempt == GITHUB_MAX_RETRIES - 1: raise error
+            metrics.inc("github_retries_total", op=op, status=status)
+            if pause_all:
+                # rate limit 은 프로세스 전체가 같이 쉬어야 하므로 새 요청을 모두 멈춤
+                with self.cond: self.paused_until = max(self.paused_until, time.time() + delay)
+            time.sleep(delay)
+
+@st.cache_resource
+def get_github_scheduler():
+    return GitHubScheduler(GITHUB_MAX_CONCURRENCY)
+
+def gh(fn, *args, bulk=False, op=None, **kwargs):
+    # 모든 GitHub 호출은 이 함수를 거침 (bulk=True: blob 일괄 조회/생성처럼 우선순위가 낮은 작업)
+    scheduler = get_github_scheduler()
+    return scheduler.call(fn, *args, priority=scheduler.BULK if bulk else scheduler.INTERACTIVE, op=op, **kwargs)
+
+@st.cache_resource
+def get_github():
+    # 📌 프로세스 전체에서 공유하는 클라이언트 (keep-alive 커넥션 풀, 재시도는 스케줄러가 담당)
+    # PyGithub 기본 요청 간격(0.25초, 쓰기 1초)은 끔 -> 병렬 blob 생성이 한 줄로 직렬화되지 않도록 (한도는 스케줄러가 관리)
+    return Github(auth=Auth.Token(GITHUB_TOKEN), base_url=GITHUB_API_URL, pool_size=GITHUB_MAX_CONCURRENCY, retry=None,
+                  seconds_between_requests=None, seconds_between_writes=None)
+
+@st.cache_resource
+def get_http_session():
+    # PyGithub 가 다루지 않는 요청(ETag 조건부 GET, raw blob 스트리밍)용 공유 세션
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=GITHUB_MAX_CONCURRENCY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Authorization": f"Bearer {GITHUB_TOKEN}", "Accept": "application/vnd.github+json"})
+    return session
+
+@st.cache_resource
+def get_repo():
+    # lazy=True: 저장소 정보 조회 왕복 없이 객체만 생성
+    return get_github().get_repo(REPO_NAME, lazy=True)
+
+def get_branch_name(repo):
+    return get_setting("branch") or gh(lambda: repo.default_branch, op="get_repo")
+
+def get_head_sha(repo):
+    return gh(repo.get_branch, get_branch_name(repo)).commit.sha
+
+def list_resource_tree(repo, ref):
+    # 📌 resources/ 하위 전체 구조를 재귀 Git Trees 호출 1회로 가져옴 (경로는 resources/ 기준 상대경로)
+    tree = gh(repo.get_git_tree, f"{ref}:{UPLOAD_DIR}", recursive=True)
+    return tree.tree, bool(tree.raw_data.get("truncated"))
+
+def description_terms(text):
+    # 설명 본문 -> 검색어(중복 제거, 나온 순서) 공백 구분 문자열, SEARCH_TERMS_CHARS 까지만
+    terms, size = [], 0
+    for token in dict.fromkeys(search_tokens(text)):
+        size += len(token) + 1
+        if size > SEARCH_TERMS_CHARS: break
+        terms.append(token)
+    return " ".join(terms)
+
+def resource_entry(folder, info_data, info_sha):
+    # 📌 info.json / 매니페스트 항목 -> 탐색 화면이 쓰는 dict, 어느 경로로 읽어도 같은 모양 (MANIFEST_FIELDS + id, path + terms)
+    # 설명 본문은 담지 않음: 미리보기 문구와 검색어(terms)만 여기서 한 번 계산, 본문은 get_description 으로 필요할 때 읽음
+    # 매니페스트에는 검색어가 없음 -> 매니페스트로 읽은 항목은 terms 없이 만들고 CatalogCache 가 info.json 에서 채움
+    entry = {k: info_data[k] for k in MANIFEST_FIELDS if k in info_data}
+    if 'preview' not in entry: entry['preview'] = clean_text_for_preview(info_data.get('description', ''))
+    if 'terms' in info_data: entry['terms'] = info_data['terms']
+    elif 'description' in info_data: entry['terms'] = description_terms(info_data['description'])
+    entry.update(id=folder, path=f"{UPLOAD_DIR}/{folder}", info_sha=info_sha)
+    return entry
+
+def read_info_blob(repo, folder, blob_sha):
+    blob = gh(repo.get_git_blob, blob_sha, bulk=True)
+    return resource_entry(folder, json.loads(base64.b64decode(blob.content).decode("utf-8")), blob_sha)
+
+def read_info_blobs(repo, info_shas, broken=None):
+    # info_shas: {폴더명: info.json blob sha} -> 동시에 받아서 dict 리스트로 반환 (실패한 폴더는 건너뜀)
+    # info.json 자체가 깨진(JSON/UTF-8 오류) 폴더는 broken[폴더명] = sha 로 따로 알려줌 -> 매니페스트에 표시
+    def _read(item):
+        try: return read_info_blob(repo, *item)
+        except ValueError:
+            if broken is not None: broken[item[0]] = item[1]
+            return None
+        except Exception: return None
+    with ThreadPoolExecutor(max_workers=GITHUB_WORKERS) as pool:
+        return [r for r in pool.map(_read, info_shas.items()) if r]
+
+def load_resources_via_contents(repo):
+    # 트리 응답이 잘린(truncated) 초대형 저장소용 예전 방식 (폴더당 1회 조회)
+    resources = []
+    for content in gh(repo.get_contents, UPLOAD_DIR):
+        if content.type == "dir":
+            try:
+                info_file = gh(repo.get_contents, f"{content.path}/info.json", bulk=True)
+                info_data = json.loads(info_file.decoded_content.decode("utf-8"))
+                resources.append(resource_entry(content.name, info_data, info_file.sha))
+            except Exception: continue
+    return resources
+
+def read_manifest(repo, blob_sha):
+    # resources/index.json -> {폴더명: 요약 항목} (blob API 라 1MB 제한 없음)
+    blob = gh(repo.get_git_blob, blob_sha)
+    return json.loads(base64.b64decode(blob.content).decode("utf-8")).get("resources", {})
+
+def manifest_content(manifest):
+    return json.dumps({"version": 1, "resources": manifest}, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+def manifest_item(res):
+    return {k: res.get(k) for k in MANIFEST_FIELDS}
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def load_resource_info(info_sha, _bulk=False):
+    # info.json 은 blob sha 로 캐싱 (내용이 바뀌면 sha 도 바뀜), _bulk: 백그라운드 대량 읽기면 True (캐시 키에서 제외)
+    blob = gh(get_repo().get_git_blob, info_sha, bulk=_bulk)
+    return json.loads(base64.b64decode(blob.content).decode("utf-8"))
+
+def get_description(res, bulk=False):
+    # 카탈로그 항목에는 설명 본문이 없으므로 필요할 때만 info.json 을 읽음
+    return load_resource_info(res['info_sha'], _bulk=bulk).get('description', '')
+
+def updated_manifest(repo, listing, update):
+    # resources/ 목록(listing)에서 현재 매니페스트를 읽고 update(manifest) 적용 -> 새 index.json 내용
+    sha = next((e.sha for e in listing if e.path == "index.json"), None)
+    manifest = read_manifest(repo, sha) if sha else {}
+    update(manifest)
+    return manifest_content(manifest)
+
+@st.cache_resource
+def get_manifest_lock():
+    return threading.Lock()
+
+def rebuild_manifest(resources, broken=None):
+    # 매니페스트가 없거나 폴더와 어긋나 있으면 읽어 둔 목록으로 다시 써서 커밋 (동시에 하나만)
+    # 깨진 info.json 폴더도 {"info_sha", "broken"} 으로 남김 -> 다음 로딩 때 개수가 맞아 또 다시 쓰지 않음
+    lock = get_manifest_lock()
+    if not lock.acquire(blocking=False): return
+    def _job():
+        try:
+            repo = get_repo()
+            manifest = {folder: {"info_sha": sha, "broken": True} for folder, sha in (broken or {}).items()}
+            manifest.update((r['id'], manifest_item(r)) for r in resources)
+            content = manifest_content(manifest)
+            element = InputGitTreeElement(MANIFEST_PATH, "100644", "blob", content=content)
+            commit = commit_tree_changes(repo, "Rebuild resources index", lambda parent: gh(repo.create_git_tree, [element], parent.tree))
+            publish_commit(commit, lambda by_id: None)
+        except Exception: pass
+        finally: lock.release()
+    threading.Thread(target=_job, daemon=True).start()
+
+def load_resources_from_github(sha=None):
+    # 📌 트리 1회 + 매니페스트 1회로 로딩, 매니페스트와 info.json blob sha 가 다른 폴더만 info.json 을 직접 읽음
+    # 실패 시 예외를 그대로 올림 -> 캐시가 빈 목록을 정상 결과로 저장하지 않도록
+    repo = get_repo()
+    entries, truncated = list_resource_tree(repo, sha or get_head_sha(repo))
+    if truncated:
+        resources = load_resources_via_contents(repo)
+    else:
+        info_shas, manifest_sha = {}, None
+        for e in entries:
+            folder, _, name = e.path.partition("/")
+            if e.type == "blob" and e.path == "index.json": manifest_sha = e.sha
+            elif e.type == "blob" and name == "info.json": info_shas[folder] = e.sha
+        manifest = read_manifest(repo, manifest_sha) if manifest_sha else {}
+        resources, stale, broken = [], {}, {}
+        for folder, info_sha in info_shas.items():
+            item = manifest.get(folder)
+            if not item or item.get("info_sha") != info_sha: stale[folder] = info_sha
+            elif item.get("broken"): broken[folder] = info_sha
+            else: resources.append(resource_entry(folder, item, info_sha))
+        resources += read_info_blobs(repo, stale, broken)
+        bloated = any("terms" in item for item in manifest.values())  # 검색어까지 싣던 예전 매니페스트 -> 한 번 다시 써서 줄임
+        if stale or bloated or len(manifest) != len(info_shas): rebuild_manifest(resources, broken)
+    return sorted(resources, key=lambda x: x.get('title', ''), reverse=True)
+
+def changed_resource_folders(repo, base_sha, head_sha):
+    # 두 커밋 사이에서 resources/<id>/ 아래가 바뀐 폴더 이름 집합 (비교 불가 시 None -> 전체 재로딩)
+    try: cmp = gh(repo.compare, base_sha, head_sha)
+    except UnknownObjectException: return None  # 기준 커밋이 사라짐 (force push 등)
+    if cmp.status not in ("ahead", "identical") or len(cmp.files) >= COMPARE_FILES_LIMIT: return None
+    folders = set()
+    for f in cmp.files:
+        for path in (f.filename, f.previous_filename):
+            if path and path.startswith(f"{UPLOAD_DIR}/") and path.count("/") >= 2:
+                folders.add(path.split("/")[1])
+    return folders
+
+def sync_resources(repo, resources, base_sha, head_sha):
+    # 📌 증분 동기화: 커밋 diff 에 걸린 폴더의 info.json 만 다시 읽고 나머지는 그대로 재사용
+    folders = changed_resource_folders(repo, base_sha, head_sha)
+    if folders is None: return load_resources_from_github(head_sha)
+    def _read(folder):
+        try:
+            info_file = gh(repo.get_contents, f"{UPLOAD_DIR}/{folder}/info.json", ref=head_sha, bulk=True)
+        except UnknownObjectException: return folder, None  # 폴더(또는 info.json) 삭제됨
+        try: return folder, resource_entry(folder, json.loads(info_file.decoded_content.decode("utf-8")), info_file.sha)
+        except ValueError: return folder, None  # info.json 이 깨짐 -> 목록에서 뺌 (전체 로딩과 같게)
+    by_id = {r['id']: r for r in resources}
+    with ThreadPoolExecutor(max_workers=GITHUB_WORKERS) as pool:
+        for folder, info_data in pool.map(_read, folders):
+            if info_data is None: by_id.pop(folder, None)
+            else: by_id[folder] = info_data
+    return sorted(by_id.values(), key=lambda x: x.get('title', ''), reverse=True)
+
+def github_http(method, path, bulk=False, **kwargs):
+    # 공유 세션 + 스케줄러를 거치는 REST 호출 (4xx/5xx 는 requests.HTTPError)
+    def _send():
+        r = get_http_session().request(method, f"{GITHUB_API_URL}{path}", **kwargs)
+        r.raise_for_status()
+        return r
+    return gh(_send, bulk=bulk, op=f"http_{method.lower()}")
+
+def github_api_get(path, etag=None):
+    # ETag 조건부 GET: 변경이 없으면 304 -> (None, etag) 반환, 이 응답은 Rate limit 에 집계되지 않음
+    r = github_http("GET", path, headers={"If-None-Match": etag} if etag else None, timeout=15)
+    if r.status_code == 304: return None, etag
+    return r.json(), r.headers.get("ETag")
+
+class CatalogCache:
+    # 📌 디스크에 저장된 마지막 카탈로그를 즉시 돌려주고, 브랜치 ref 를 ETag 로 재검증 (stale-while-revalidate)
+    # 파일 구조: {CACHE_DIR}/catalog/{owner__repo}/latest.json (sha, etag, checked_at) + {sha}.v{CATALOG_FORMAT}.json (리소스 목록)
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self.sync_lock = threading.Lock()
+        self.bg_lock = threading.Lock()
+        self.revalidating = False
+        self.filling = False
+        self.branch = None
+        self.state = self._read_json("latest.json") or {}
+        self.resources = self._read_json(self._snapshot(self.state['sha'])) if self.state.get("sha") else None
+        self.published = (self.resources or [], self._version(self.resources, self.state))  # 세션들이 참조하는 (목록, 버전) 한 쌍
+        if self.resources: self.fill_terms_in_background()
+
+    @staticmethod
+    def _version(resources, state):
+        # 카탈로그 버전 = 커밋 SHA, 검색어(terms)를 아직 못 채운 항목이 있으면 ":partial" -> 채운 뒤 검색 색인이 다시 만들어짐
+        sha = state.get("sha")
+        return f"{sha}:partial" if sha and any('terms' not in r for r in resources or ()) else sha
+
+    @staticmethod
+    def _snapshot(sha):
+        return f"{sha}.v{CATALOG_FORMAT}.json"
+
+    def _read_json(self, name):
+        try:
+            with open(os.path.join(self.root, name), encoding="utf-8") as f: return json.load(f)
+        except (OSError, ValueError): return None
+
+    def _write_json(self, name, data):
+        path = os.path.join(self.root, name)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f: json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def _prune(self):
+        snaps = [n for n in os.listdir(self.root) if n.endswith(".json") and n != "latest.json"]
+        snaps.sort(key=lambda n: os.path.getmtime(os.path.join(self.root, n)), reverse=True)
+        for name in snaps[CATALOG_CACHE_KEEP:]:
+            try: os.remove(os.path.join(self.root, name))
+            except OSError: pass
+
+    def get(self):
+        # -> (리소스 목록, 커밋 SHA): 목록은 교체만 하고 수정하지 않으므로 여러 세션이 복사 없이 같이 참조
+        if self.resources is None:
+            try: self.revalidate()
+            except Exception: return [], None
+        elif time.time() - self.state.get("checked_at", 0) > CATALOG_REVALIDATE_SECONDS:
+            self.revalidate_in_background()
+        return self.published
+
+    def _publish(self, resources, state):
+        self.resources, self.state = resources, state
+        self.published = (resources or [], self._version(resources, state))  # 목록과 버전을 한 번에 교체 -> 읽는 쪽에서 짝이 어긋나지 않음
+        self._write_json("latest.json", state)
+        get_metrics().set_gauge("catalog_resources", len(resources or []))
+        if self.published[1] != state.get("sha"): self.fill_terms_in_background()
+
+    def fill_terms_in_background(self):
+        with self.bg_lock:
+            if self.filling or not self.resources: return
+            self.filling = True
+        threading.Thread(target=self._fill_terms, daemon=True).start()
+
+    def _fill_terms(self):
+        # 📌 매니페스트로만 읽은 항목(전체 로딩)은 검색어가 없음 -> info.json 을 bulk 우선순위로 읽어 채우고 스냅샷에 저장
+        # 한 번 채운 항목은 스냅샷/증분 동기화로 이어지므로 다시 읽는 것은 처음 로딩(또는 비교 실패) 때뿐
+        try:
+            while True:
+                resources, sha = self.resources, self.state.get("sha")
+                missing = {r['id']: r['info_sha'] for r in resources or () if 'terms' not in r}
+                if not missing: return
+                read = {r['id']: r for r in read_info_blobs(get_repo(), missing)}
+                if not read: return  # 전부 실패(네트워크 등) -> 다음 게시 때 다시 시도
+                with self.sync_lock:
+                    if self.state.get("sha") != sha: continue  # 그 사이 새 커밋 -> 바뀐 목록 기준으로 다시
+                    # 읽지 못한 항목은 빈 검색어로 -> 같은 항목을 계속 다시 읽지 않음 (info.json 이 바뀌면 증분 동기화가 새로 읽음)
+                    filled = [r if 'terms' in r else read.get(r['id']) or dict(r, terms="") for r in self.resources]
+                    self._write_json(self._snapshot(sha), filled)
+                    self._publish(filled, self.state)
+                get_metrics().inc("catalog_terms_filled_total", len(read))
+                return
+        except Exception: pass
+        finally: self.filling = False
+
+    def apply_commit(self, commit, update):
+        # 📌 이 프로세스가 만든 커밋은 다시 읽지 않고 바로 반영: update(by_id) 가 바뀐 폴더만 고친 새 목록을 만듦
+        # 캐시가 그 커밋의 부모 기준이 아니면(다른 커밋이 끼어듦) 평소처럼 재검증
+        with self.sync_lock:
+            if self.resources is not None and commit.parents and self.state.get("sha") == commit.parents[0].sha:
+                by_id = {r['id']: r for r in self.resources}
+                update(by_id)
+                resources = sorted(by_id.values(), key=lambda x: x.get('title', ''), reverse=True)
+                self._write_json(self._snapshot(commit.sha), resources)
+                self._prune()
+                self._publish(resources, dict(self.state, sha=commit.sha, etag=None, checked_at=time.time()))
+                get_metrics().inc("catalog_apply_total", result="patched")
+                return
+        get_metrics().inc("catalog_apply_total", result="revalidated")
+        self.revalidate()
+
+    def revalidate_in_background(self):
+        with self.bg_lock:
+            if self.revalidating: return
+            self.revalidating = True
+        threading.Thread(target=self._background_job, daemon=True).start()
+
+    def _background_job(self):
+        try: self.revalidate()
+        except Exception: pass
+        finally: self.revalidating = False
+
+    def _build(self, sha):
+        # 이전 커밋 카탈로그가 있으면 diff 만큼만, 없으면 전체 로딩
+        if self.resources is not None and self.state.get("sha"):
+            with get_metrics().timer("catalog_load", mode="sync"):
+                return sync_resources(get_repo(), self.resources, self.state["sha"], sha)
+        with get_metrics().timer("catalog_load", mode="full"): return load_resources_from_github(sha)
+
+    def revalidate(self):
+        with self.sync_lock:
+            if not self.branch: self.branch = get_branch_name(get_repo())
+            etag = self.state.get("etag") if self.resources is not None else None
+            ref, etag = github_api_get(f"/repos/{REPO_NAME}/git/ref/heads/{self.branch}", etag)
+            state = dict(self.state, checked_at=time.time())
+            get_metrics().inc("catalog_revalidate_total", status=304 if ref is None else 200)
+            resources = self.resources
+            if ref is not None:
+                sha = ref["object"]["sha"]
+                if sha != self.state.get("sha") or self.resources is None:
+                    resources = self._read_json(self._snapshot(sha))
+                    if resources is None:
+                        resources = self._build(sha)
+                        self._write_json(self._snapshot(sha), resources)
+                        self._prune()
+                state.update(sha=sha, etag=etag)
+            self._publish(resources, state)
+            return self.resources
+
+@st.cache_resource
+def get_catalog_cache():
+    return CatalogCache(os.path.join(CACHE_DIR, "catalog", REPO_NAME.replace("/", "__")))
+
+def publish_commit(commit, update):
+    # GitHub 백엔드일 때만: 방금 만든 커밋을 프로세스 공용 카탈로그에 반영 (local 미러링 커밋은 해당 없음)
+    # 커밋은 이미 저장소에 들어갔으므로 반영 실패는 오류로 올리지 않고 백그라운드 재검증으로 넘김
+    if STORAGE_BACKEND != "github": return
+    try: get_catalog_cache().apply_commit(commit, update)
+    except Exception: get_catalog_cache().revalidate_in_background()
+
+def refresh_resources():
+    # 🔄 새로고침: 캐시를 버리지 않고 즉시 재검증 (GitHub 는 변경 없으면 304 로 끝남)
+    try: get_storage().refresh()
+    except Exception as e: st.warning(f"⚠️ 최신 목록 확인 실패, 마지막 목록을 표시합니다. ({e})")
+
+def search_tokens(text):
+    return [t for t in re.split(r"[^\w]+", str(text or "").lower()) if t]
+
+def char_ngrams(token, n=2):
+    # 한글 합성어(회의록아카이빙)도 부분 검색되도록 글자 n-gram 으로 쪼갬
+    if len(token) <= n: return [token]
+    return [token[i:i + n] for i in range(len(token) - n + 1)]
+
+class SearchIndex:
+    # 📌 카탈로그 버전(커밋 SHA)마다 한 번 만드는 역색인
+    # 필드별 postings[gram] = 정렬된 문서 번호 배열(int32), 검색어는 단어 단위 AND / 필드 가중치 x idf 로 점수 계산
+    # 점수는 문서 수 길이의 numpy 배열로 한 번에 더하고, 정렬은 SearchResults 가 화면에 보이는 만큼만
+    def __init__(self, resources):
+        self.resources = resources
+        self.doc_of = {r['id']: doc for doc, r in enumerate(resources)}
+        self.titles = np.array(["".join(search_tokens(r.get('title', ''))) for r in resources], dtype=str)
+        self.postings = {}
+        self.memo = {}  # 같은 검색어로 재실행(rerun)될 때는 바로 반환
+        for field in SEARCH_FIELD_WEIGHTS:
+            postings = defaultdict(list)
+            for doc, res in enumerate(resources):
+                value = res.get(field, res.get('preview', '') if field == "terms" else '') or ''  # 검색어를 채우기 전에는 미리보기 문구로
+                if isinstance(value, list): value = " ".join(value)
+                tokens = search_tokens(value)
+                grams = set()
+                for token in tokens: grams.update(char_ngrams(token))
+                if field != "terms":
+                    # 짧은 필드는 한 글자 검색과 띄어쓰기 없는 검색(회의록아카이빙 -> "회의록 아카이빙")도 지원
+                    grams.update("".join(tokens))
+                    grams.update(char_ngrams("".join(tokens)))
+                for gram in grams: postings[gram].append(doc)
+            self.postings[field] = {g: np.array(docs, np.int32) for g, docs in postings.items()}
+
+    def _idf(self, df):
+        return math.log(1 + len(self.resources) / df)
+
+    def _match(self, field, grams):
+        lists = [self.postings[field].get(g) for g in grams]
+        if not lists or any(p is None for p in lists): return None, 0.0
+        lists.sort(key=len)
+        docs = lists[0]
+        for p in lists[1:]:
+            docs = np.intersect1d(docs, p, assume_unique=True)
+            if not len(docs): break
+        return docs, sum(self._idf(len(p)) for p in lists)
+
+    def search(self, query):
+        key = " ".join(search_tokens(query))
+        if key not in self.memo:
+            if len(self.memo) >= 256: self.memo.clear()
+            self.memo[key] = self._search(key)
+        return self.memo[key]
+
+    def _search(self, query):
+        if not search_tokens(query): return list(self.resources)
+        return SearchResults(self.resources, *self.scored(query))
+
+    def _term_scores(self, term):
+        # 검색어 단어 1개 -> 문서별 점수 배열 (0 = 일치 없음)
+        scores = np.zeros(len(self.resources))
+        title_docs = None
+        for field, weight in SEARCH_FIELD_WEIGHTS.items():
+            docs, idf = self._match(field, char_ngrams(term))
+            if docs is None or not len(docs): continue
+            scores[docs] += weight * idf
+            if field == "title": title_docs = docs
+        if title_docs is not None:
+            scores[title_docs[np.char.find(self.titles[title_docs], term) >= 0]] *= 2  # 제목에 그대로 들어있으면 가산점
+        return scores
+
+    def scored(self, query):
+        # -> (문서 번호 배열, 점수 배열) 문서 번호 순 (혼합 검색에서 의미 점수와 섞을 때도 사용)
+        total = None
+        for term in search_tokens(query):
+            scores = self._term_scores(term)
+            total = scores if total is None else np.where((total > 0) & (scores > 0), total + scores, 0.0)
+            if not total.any(): break
+        docs = np.flatnonzero(total) if total is not None else np.zeros(0, np.intp)
+        return docs, total[docs] if total is not None else np.zeros(0)
+
+class SearchResults:
+    # 📌 검색 결과 목록: 전체를 정렬하지 않고 잘라 쓰는 구간(페이지)까지만 순위를 매김
+    # 순서는 점수 내림차순, 같은 점수는 문서 번호 순 -> 어느 구간을 잘라도 전체 정렬 결과와 같음
+    def __init__(self, resources, docs, scores):
+        self.resources, self.docs, self.scores = resources, docs, scores
+        self.order = None  # 전체 순회(모두 선택 등) 때 한 번 만든 전체 순위
+
+    def __len__(self):
+        return len(self.docs)
+
+    def _top(self, k):
+        # 상위 k개의 (docs/scores 배열) 위치: k번째 점수 이상만 추린 뒤(argpartition 과 같은 O(n)) 그 안에서만 정렬
+        if self.order is not None: return self.order[:k]
+        n = len(self.docs)
+        if k <= 0: return np.zeros(0, np.intp)
+        if k < n: pick = np.flatnonzero(self.scores >= np.partition(self.scores, n - k)[n - k])
+        else: pick = np.arange(n)
+        ranked = pick[np.lexsort((self.docs[pick], -self.scores[pick]))][:k]
+        if k >= n: self.order = ranked
+        return ranked
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            positions = range(*index.indices(len(self)))
+            top = self._top(max(positions) + 1) if positions else ()
+            return [self.resources[self.docs[top[i]]] for i in positions]
+        if index < 0: index += len(self)
+        if not 0 <= index < len(self): raise IndexError(index)
+        return self.resources[self.docs[self._top(index + 1)[index]]]
+
+    def __iter__(self):
+        return (self.resources[self.docs[i]] for i in self._top(len(self)))
+
+@st.cache_resource(max_entries=2)
+def get_search_index(catalog_sha, _resources):
+    # _resources 는 해시하지 않음 -> 카탈로그 SHA 가 바뀔 때만 다시 만듦
+    return SearchIndex(_resources)
+
+class HashingEmbedder:
+    # 결정적 로컬 임베딩: 단어/글자 n-gram 을 crc32 로 고정 차원에 흩뿌림 (외부 호출 없음, 같은 입력이면 항상 같은 벡터)
+    def __init__(self, dim=EMBED_HASH_DIM):
+        self.dim, self.name = dim, f"hashing-{dim}"
+
+    def embed(self, texts):
+        out = np.zeros((len(texts), self.dim), np.float32)
+        for row, text in enumerate(texts):
+            for token in search_tokens(text):
+                for gram in {token, *char_ngrams(token)}:
+                    h = zlib.crc32(gram.encode("utf-8"))
+                    out[row, h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+        return out
+
+class OpenAIEmbedder:
+    def __init__(self, model=EMBEDDING_MODEL):
+        self.model, self.name = model, f"openai-{model}"
+
+    def embed(self, texts):
+        with get_metrics().timer("openai_request", mode="embed"):
+            resp = get_openai_client().embeddings.create(model=self.model, input=texts)
+        return np.array([d.embedding for d in sorted(resp.data, key=lambda d: d.index)], np.float32)
+
+# 📌 임베딩 제공자 등록부: 이름 -> 생성 함수 (Secrets embedding_provider 로 선택, 새 모델은 여기에 추가)
+EMBEDDERS = {"openai": OpenAIEmbedder, "hashing": HashingEmbedder}
+
+def embedding_text(res):
+    # 제목 + 분류 + 설명 본문 (자리표시 문구는 제외), 설명은 info.json 에서 읽음 (백필이므로 bulk 우선순위)
+    desc = get_storage().description(res, bulk=True) or ""
+    if desc == DESC_PLACEHOLDER: desc = ""
+    return "\n".join(x for x in (res.get('title'), res.get('category'), desc[:EMBED_TEXT_CHARS]) if x) or "-"
+
+class EmbeddingIndex:
+    # 📌 리소스 임베딩을 float32 행렬 1개(행 = 리소스, 단위 벡터) + 행 순서대로의 id 목록으로 보관
+    # 파일 구조: {dir}/{provider}.npy (행렬) + {provider}.json (ids, 행별 info_sha) -> info_sha 가 바뀐 리소스만 다시 계산
+    # 검색은 행렬 x 질의 벡터 한 번(코사인) + argpartition 으로 상위 k개
+    def __init__(self, directory, provider):
+        self.directory, self.provider = directory, provider
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, provider.name)
+        self.matrix_path, self.meta_path = base + ".npy", base + ".json"
+        self.lock = threading.Lock()
+        self.bg_lock = threading.Lock()
+        self.running = False
+        self.pending = None  # 백그라운드 작업 중에 들어온 최신 카탈로그
+        self.synced_version = None
+        self.failures, self.retry_at = 0, 0.0  # 연속 실패 횟수 / 이 시각 전에는 다시 시도하지 않음
+        self.query_memo = {}
+        self.published = self._load()  # (ids, info_shas, matrix) 를 한 번에 교체
+        self.active = bool(self.published[0])  # 의미/혼합 검색을 쓴 적이 있으면 True -> 이후 카탈로그 변경도 따라감
+
+    def _load(self):
+        try:
+            with open(self.meta_path, encoding="utf-8") as f: meta = json.load(f)
+            matrix = np.load(self.matrix_path)
+            if matrix.dtype == np.float32 and matrix.ndim == 2 and len(matrix) == len(meta["ids"]):
+                return meta["ids"], meta["info_sha"], matrix
+        except (OSError, ValueError, KeyError):
+            pass
+        return [], [], np.zeros((0, 0), np.float32)
+
+    def _save(self, ids, stamps, matrix):
+        # 행렬 -> id 목록 순서로 교체 (중간에 멈추면 행 수가 어긋나서 _load 가 버리고 다시 계산)
+        with open(self.matrix_path + ".tmp", "wb") as f: np.save(f, matrix)
+        with open(self.meta_path + ".tmp", "w", encoding="utf-8") as f: json.dump({"ids": ids, "info_sha": stamps}, f)
+        os.replace(self.matrix_path + ".tmp", self.matrix_path)
+        os.replace(self.meta_path + ".tmp", self.meta_path)
+
+    def _commit(self, ids, stamps, matrix):
+        self._save(ids, stamps, matrix)
+        self.published = (ids, stamps, matrix)
+        get_metrics().set_gauge("embedding_rows", len(ids))
+
+    def _put(self, rows, vectors):
+        # rows: [(id, info_sha)], vectors: (n, d) -> 정규화해서 기존 행은 교체, 새 리소스는 뒤에 추가
+        vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        with self.lock:
+            ids, stamps, matrix = self.published
+            ids, stamps = list(ids), list(stamps)
+            matrix = vectors[:0] if not len(ids) else matrix
+            pos = {rid: i for i, rid in enumerate(ids)}
+            update = [(pos[rid], i) for i, (rid, _) in enumerate(rows) if rid in pos]
+            append = [i for i, (rid, _) in enumerate(rows) if rid not in pos]
+            matrix = np.concatenate([matrix, vectors[append]]) if append else matrix.copy()
+            for row, i in update:
+                matrix[row], stamps[row] = vectors[i], rows[i][1]
+            for i in append:
+                ids.append(rows[i][0])
+                stamps.append(rows[i][1])
+            self._commit(ids, stamps, matrix)
+
+    def _retain(self, live):
+        with self.lock:
+            ids, stamps, matrix = self.published
+            keep = [i for i, rid in enumerate(ids) if rid in live]
+            if len(keep) == len(ids): return
+            self._commit([ids[i] for i in keep], [stamps[i] for i in keep], matrix[keep])
+
+    def sync(self, resources, version):
+        # 카탈로그 버전이 바뀌었을 때만: 삭제된 리소스 행은 빼고, 없거나 info.json 이 바뀐 리소스는 백그라운드에서 임베딩
+        self.active = True
+        if version == self.synced_version or time.time() < self.retry_at: return
+        self.synced_version = version
+        with self.bg_lock:
+            self.pending = resources
+            if self.running: return
+            self.running = True
+        threading.Thread(target=self._background_job, daemon=True).start()
+
+    def sync_if_active(self, resources, version):
+        # 업로드/캐시 워머용: 이 프로세스에서 의미 검색을 쓰는 중일 때만 갱신 (키워드만 쓰면 임베딩 비용 없음)
+        if self.active: self.sync(resources, version)
+
+    def _background_job(self):
+        while True:
+            with self.bg_lock:
+                resources, self.pending = self.pending, None
+                if resources is None:
+                    self.running = False
+                    return
+            try:
+                with get_metrics().timer("embedding_sync", provider=self.provider.name): self._sync(resources)
+                self.failures = 0
+            except Exception:
+                # 다음 실행 때 다시 시도하되 연속 실패마다 대기 시간을 늘림 (이미 계산한 행은 저장돼 있어 이어서 진행)
+                self.failures += 1
+                self.retry_at = time.time() + min(EMBED_RETRY_SECONDS * 2 ** (self.failures - 1), EMBED_RETRY_MAX_SECONDS)
+                self.synced_version = None
+
+    def _sync(self, resources):
+        self._retain({r['id'] for r in resources})
+        ids, stamps, _ = self.published
+        known = dict(zip(ids, stamps))
+        todo = [r for r in resources if known.get(r['id']) != r.get('info_sha')]
+        rows, vectors = [], []
+        try:
+            with ThreadPoolExecutor(max_workers=GITHUB_WORKERS) as pool:
+                for start in range(0, len(todo), EMBED_BATCH):
+                    batch = todo[start:start + EMBED_BATCH]
+                    vectors.append(self.provider.embed(list(pool.map(embedding_text, batch))))
+                    rows += [(r['id'], r.get('info_sha')) for r in batch]
+                    if len(rows) >= EMBED_FLUSH_ROWS:
+                        self._put(rows, np.concatenate(vectors))
+                        rows, vectors = [], []
+        finally:
+            if rows: self._put(rows, np.concatenate(vectors))  # 중간에 실패해도 끝난 배치까지는 저장
+
+    def progress(self):
+        return len(self.published[0])
+
+    def _query_vector(self, query):
+        key = " ".join(search_tokens(query))
+        if key not in self.query_memo:
+            if len(self.query_memo) >= 256: self.query_memo.clear()
+            vector = self.provider.embed([query])[0]
+            self.query_memo[key] = vector / max(float(np.linalg.norm(vector)), 1e-12)
+        return self.query_memo[key]
+
+    def top_k(self, query, k=SEMANTIC_TOP_K):
+        # -> [(id, 코사인 점수)] 점수 내림차순
+        ids, _, matrix = self.published
+        if not ids: return []
+        with get_metrics().timer("semantic_search"):
+            scores = matrix @ self._query_vector(query)
+            k = min(k, len(ids))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+        return [(ids[i], float(scores[i])) for i in top]
+
+@st.cache_resource
+def get_embedding_index():
+    # 카탈로그 옆에 저장: GitHub 는 카탈로그 캐시 폴더, local 은 SQLite 파일과 같은 폴더
+    # embedding_provider 설정이 EMBEDDERS 에 없으면 None -> 의미 검색만 끄고 키워드 검색은 그대로
+    if EMBEDDING_PROVIDER not in EMBEDDERS: return None
+    root = os.path.dirname(LOCAL_DB_PATH) if STORAGE_BACKEND == "local" else get_catalog_cache().root
+    return EmbeddingIndex(os.path.join(root or ".", "embeddings"), EMBEDDERS[EMBEDDING_PROVIDER]())
+
+def sync_embeddings():
+    # 현재 카탈로그 기준으로 임베딩 갱신 요청 (바로 반환, 계산은 백그라운드, 의미 검색을 쓰는 중일 때만)
+    index = get_embedding_index()
+    if index is None: return
+    resources, version = get_storage().catalog()
+    index.sync_if_active(resources, version)
+
+def search_resources(resources, catalog_version, query, mode):
+    # 📌 키워드: 역색인 / 의미: 임베딩 코사인 상위 k / 혼합: 두 점수를 섞어서 정렬
+    keyword = get_search_index(catalog_version, resources)
+    if mode == "키워드": return keyword.search(query)
+    # 질의 임베딩은 실행 중에 바로 호출 -> 제공자 오류(시간 초과, 429, 키 오류)는 화면을 깨지 않고 키워드 결과로 대신함
+    try: semantic = get_embedding_index().top_k(query)
+    except Exception as e:
+        get_metrics().inc("semantic_search_errors_total")
+        st.warning(f"⚠️ 의미 검색 실패, 키워드 검색 결과를 표시합니다. ({e})")
+        return keyword.search(query)
+    if mode == "의미": return [resources[keyword.doc_of[rid]] for rid, _ in semantic if rid in keyword.doc_of]
+    docs, scores = keyword.scored(" ".join(search_tokens(query)))
+    blended, hit = np.zeros(len(resources)), np.zeros(len(resources), bool)
+    if len(docs): blended[docs], hit[docs] = (1 - HYBRID_ALPHA) * scores / scores.max(), True
+    for rid, score in semantic:
+        if rid in keyword.doc_of: blended[keyword.doc_of[rid]] += HYBRID_ALPHA * max(score, 0.0); hit[keyword.doc_of[rid]] = True
+    docs = np.flatnonzero(hit)
+    return SearchResults(resources, docs, blended[docs])
+
+def report_github_error(e):
+    # PyGithub(GithubException) / 직접 호출(requests.HTTPError) 오류를 같은 문구로 표시
+    status = e.status if isinstance(e, GithubException) else e.response.status_code
+    if status == 409:
+        st.error("🚨 보안 경고: 파일 안에 OpenAI Key 같은 비밀 정보가 포함되어 있어 GitHub가 업로드를 차단했습니다. 키를 지우고 다시 시도하세요.")
+    else:
+        st.error(f"❌ GitHub 오류 ({status}): {e.data if isinstance(e, GithubException) else e.response.text}")
+    st.stop()
+
+def commit_tree_changes(repo, message, build_tree, retries=3):
+    # 📌 Git Data API 로 커밋 1개 생성: build_tree(부모 커밋) -> 새 트리, 이후 브랜치 ref 이동
+    # 그 사이 다른 커밋이 끼어들면(422 fast-forward 실패) 최신 HEAD 기준으로 트리를 다시 만듦
+    ref = gh(repo.get_git_ref, f"heads/{get_branch_name(repo)}")
+    for attempt in range(retries):
+        parent = gh(repo.get_git_commit, ref.object.sha)
+        commit = gh(repo.create_git_commit, message, build_tree(parent), [parent])
+        try:
+            gh(ref.edit, commit.sha)
+            return commit
+        except GithubException as e:
+            if e.status != 422 or attempt == retries - 1: raise
+            ref = gh(repo.get_git_ref, f"heads/{get_branch_name(repo)}")
+
+def create_blob(repo, content_bytes):
+    return gh(repo.create_git_blob, base64.b64encode(content_bytes).decode("ascii"), "base64", bulk=True).sha
+
+class Base64BlobBody:
+    # 📌 blob 생성 요청 본문 {"encoding":"base64","content":"..."} 을 청크 단위로 인코딩해서 내보냄
+    # __len__ 이 있으므로 requests 가 Content-Length 를 붙이고 그대로 스트리밍, 재시도 시에는 처음부터 다시 읽음
+    PREFIX, SUFFIX = b'{"encoding":"base64","content":"', b'"}'
+
+    def __init__(self, fileobj, size, on_progress):
+        self.fileobj, self.size, self.on_progress = fileobj, size, on_progress
+
+    def __len__(self):
+        return len(self.PREFIX) + 4 * ((self.size + 2) // 3) + len(self.SUFFIX)
+
+    def __iter__(self):
+        self.fileobj.seek(0)
+        done = 0
+        self.on_progress(done)
+        yield self.PREFIX
+        while chunk := self.fileobj.read(BLOB_UPLOAD_CHUNK):
+            yield base64.b64encode(chunk)
+            done += len(chunk)
+            self.on_progress(done)  # 누적 바이트 (재시도하면 0부터 다시)
+        yield self.SUFFIX
+
+def stream_blob(fileobj, size, on_progress):
+    # 대용량 파일: 업로드 버퍼에서 바로 읽어 Git blobs 엔드포인트로 전송 (Contents API 크기 제한/전체 복사 없음)
+    body = Base64BlobBody(fileobj, size, on_progress)
+    r = github_http("POST", f"/repos/{REPO_NAME}/git/blobs", bulk=True, data=body,
+                    headers={"Content-Type": "application/json"}, timeout=600)
+    return r.json()["sha"]
+
+def git_blob_sha(f, size=None):
+    # git 과 같은 방식("blob <크기>\0" + 내용 의 SHA-1)으로 로컬에서 blob SHA 계산 (size 생략 시 업로드 파일의 f.size)
+    h = hashlib.sha1(f"blob {f.size if size is None else size}\0".encode("ascii"))
+    f.seek(0)
+    while chunk := f.read(BLOB_UPLOAD_CHUNK): h.update(chunk)
+    f.seek(0)
+    return h.hexdigest()
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def known_blob_shas(head_sha):
+    # resources/ 아래에 이미 있는 blob SHA 집합 (재귀 트리 1회, HEAD 가 같으면 캐시)
+    entries, _ = list_resource_tree(get_repo(), head_sha)
+    return frozenset(e.sha for e in entries if e.type == "blob")
+
+def upload_to_github(folder_name, files, meta_data):
+    repo = get_repo()
+    base_path = f"{UPLOAD_DIR}/{folder_name}"
+    
+    progress_text = "파일 업로드 시작..."
+    my_bar = st.progress(0, text=progress_text)
+    
+    json_content = json.dumps(meta_data, ensure_ascii=False, indent=4).encode("utf-8")
+    total_bytes = sum(f.size for f in files) + len(json_content)
+    progress = {}  # 경로 -> 전송한 바이트
+    
+    # 📌 내용 주소 기반 중복 제거: 저장소에 이미 있는(또는 이번 업로드에서 겹치는) blob 은 다시 보내지 않고 SHA 로 재사용
+    try: known = known_blob_shas(get_head_sha(repo))
+    except UnknownObjectException: known = frozenset()  # resources/ 가 아직 없음
+    shas, to_upload, first_path = {}, [], {}
+    report = {"skipped_files": 0, "skipped_bytes": 0}
+    for f in files:
+        path, sha = f"{base_path}/{f.name}", git_blob_sha(f)
+        if sha in known or sha in first_path:
+            shas[path] = sha
+            progress[path] = f.size
+            report["skipped_files"] += 1
+            report["skipped_bytes"] += f.size
+        else:
+            first_path[sha] = path
+            to_upload.append((path, f))
+    large_slots = threading.Semaphore(LARGE_UPLOAD_SLOTS)
+
+    def upload_file(path, f):
+        if f.size < LARGE_FILE_BYTES:
+            sha = create_blob(repo, f.getvalue())
+        else:
+            with large_slots: sha = stream_blob(f, f.size, lambda n: progress.__setitem__(path, n))
+        progress[path] = f.size
+        return sha
+
+    def upload_info(path):
+        sha = create_blob(repo, json_content)
+        progress[path] = len(json_content)
+        return sha
+    
+    # 📌 blob 은 병렬 생성(큰 파일은 스트리밍) -> 트리 1개 + 커밋 1개로 한 번에 반영 (중간 실패 시 info.json 없는 폴더가 남지 않음)
+    try:
+        with ThreadPoolExecutor(max_workers=GITHUB_WORKERS) as pool:
+            futures = {pool.submit(upload_file, path, f): path for path, f in to_upload}
+            futures[pool.submit(upload_info, f"{base_path}/info.json")] = f"{base_path}/info.json"
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=0.3, return_when=FIRST_COMPLETED)
+                for future in done: shas[futures[future]] = future.result()
+                mb, sent = 1024 * 1024, sum(progress.values())
+                percent = min(int(sent / max(total_bytes, 1) * 95), 95)
+                my_bar.progress(percent, text=f"Uploading: {sent / mb:,.1f} / {total_bytes / mb:,.1f} MB ({len(shas)}/{len(files) + 1}개 파일)")
+        elements = [InputGitTreeElement(path, "100644", "blob", sha=sha) for path, sha in shas.items()]
+        
+        # 매니페스트(resources/index.json)도 같은 커밋에서 갱신
+        item = manifest_item(resource_entry(folder_name, dict(meta_data), shas[f"{base_path}/info.json"]))
+        def build_tree(parent):
+            try: listing = gh(repo.get_git_tree, f"{parent.sha}:{UPLOAD_DIR}").tree
+            except UnknownObjectException: listing = []
+            content = updated_manifest(repo, listing, lambda m: m.__setitem__(folder_name, item))
+            manifest = InputGitTreeElement(MANIFEST_PATH, "100644", "blob", content=content)
+            return gh(repo.create_git_tree, elements + [manifest], parent.tree)
+        
+        my_bar.progress(97, text="커밋 생성 중...")
+        commit = commit_tree_changes(repo, f"Add {folder_name}", build_tree)
+    except (GithubException, requests.HTTPError) as e:
+        report_github_error(e)
+    publish_commit(commit, lambda by_id: by_id.__setitem__(folder_name, resource_entry(folder_name, meta_data, item['info_sha'])))
+    
+    my_bar.progress(100, text="업로드 완료!")
+    my_bar.empty()
+    return report
+
+def delete_from_github(folder_path):
+    # 📌 resources/<id> 하위(중첩 폴더 포함)를 트리 재작성 + 커밋 1개로 삭제 -> 파일 수와 상관없이 API 호출 수 고정
+    repo = get_repo()
+    parent_dir, name = folder_path.rsplit("/", 1)
+    head_sha = gh(repo.get_git_ref, f"heads/{get_branch_name(repo)}").object.sha
+    removed = [e.path for e in gh(repo.get_git_tree, f"{head_sha}:{folder_path}", recursive=True).tree if e.type == "blob"]
+
+    def build_tree(parent):
+        listing = gh(repo.get_git_tree, f"{parent.sha}:{parent_dir}").tree
+        keep = [InputGitTreeElement(e.path, e.mode, e.type, sha=e.sha) for e in listing if e.path not in (name, "index.json")]
+        if keep:
+            # 매니페스트에서도 같은 커밋으로 제거
+            content = updated_manifest(repo, listing, lambda m: m.pop(name, None))
+            keep.append(InputGitTreeElement("index.json", "100644", "blob", content=content))
+            new_dir = gh(repo.create_git_tree, keep)
+            return gh(repo.create_git_tree, [InputGitTreeElement(parent_dir, "040000", "tree", sha=new_dir.sha)], parent.tree)
+        # 마지막 리소스를 지우면 resources/ 자체가 비므로 루트에서 제거
+        root = gh(repo.get_git_tree, parent.tree.sha).tree
+        return gh(repo.create_git_tree, [InputGitTreeElement(e.path, e.mode, e.type, sha=e.sha) for e in root if e.path != parent_dir])
+
+    commit = commit_tree_changes(repo, f"Delete {name}", build_tree)
+    publish_commit(commit, lambda by_id: by_id.pop(name, None))
+    return removed
+
+def list_tree_files(repo, tree_sha):
+    # 리소스 폴더 트리의 파일 목록 (중첩 폴더 포함, info.json 제외): [(폴더 기준 경로, blob sha, 크기)]
+    tree = gh(repo.get_git_tree, tree_sha, recursive=True).tree
+    return [(e.path, e.sha, e.size) for e in tree if e.type == "blob" and e.path != "info.json"]
+
+def fetch_raw_blob(sha):
+    # raw 미디어 타입으로 받아서 base64 디코딩/1MB 제한 없이 청크 단위로 기록 (본문 수신까지 스케줄러 슬롯 유지)
+    def _fetch():
+        buf = tempfile.SpooledTemporaryFile(max_size=BLOB_SPOOL_BYTES)
+        url = f"{GITHUB_API_URL}/repos/{REPO_NAME}/git/blobs/{sha}"
+        with get_http_session().get(url, headers={"Accept": "application/vnd.github.raw"}, stream=True, timeout=60) as r:
+            r.raise_for_status()
+            get_github_scheduler().observe(r.headers)
+            for chunk in r.iter_content(STREAM_CHUNK): buf.write(chunk)
+        buf.seek(0)
+        return buf
+    return gh(_fetch, bulk=True, op="get_raw_blob")
+
+def write_blobs_to_zip(zf, jobs):
+    # jobs: [(zip 내 경로, blob sha, 크기)] -> 워커 풀에서 병렬로 받고 도착 순서대로 기록
+    with ThreadPoolExecutor(max_workers=GITHUB_WORKERS) as pool:
+        queue, pending = iter(jobs), {}
+        def submit_next():
+            job = next(queue, None)
+            if job: pending[pool.submit(fetch_raw_blob, job[1])] = job
+        # 동시에 들고 있는 blob 수를 워커 수의 2배로 제한
+        for _ in range(GITHUB_WORKERS * 2): submit_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                zip_path, _, size = pending.pop(future)
+                info = zipfile.ZipInfo(zip_path, date_time=time.localtime()[:6])
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.file_size = size
+                with future.result() as blob, zf.open(info, "w") as dst: shutil.copyfileobj(blob, dst, STREAM_CHUNK)
+                submit_next()
+
+def resource_zip_path(tree_sha):
+    return os.path.join(CACHE_DIR, "zips", f"{tree_sha}.zip")
+
+def get_resource_zip(repo, tree_sha):
+    # 📌 리소스 폴더 트리 SHA 로 키잉된 압축본 캐시: 내용이 같으면 SHA 도 같으므로 무효화가 필요 없음
+    path = resource_zip_path(tree_sha)
+    cache_dir = os.path.dirname(path)
+    if os.path.exists(path):
+        os.utime(path)
+        get_metrics().inc("zip_cache_total", result="hit")
+        return path
+    get_metrics().inc("zip_cache_total", result="miss")
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with get_metrics().timer("zip_build"), zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as zf:
+        write_blobs_to_zip(zf, list_tree_files(repo, tree_sha))
+    os.replace(tmp, path)
+    prune_zip_cache(cache_dir)
+    return path
+
+def prune_zip_cache(cache_dir):
+    entries = [os.path.join(cache_dir, n) for n in os.listdir(cache_dir) if n.endswith(".zip")]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    total = 0
+    for path in entries:
+        total += os.path.getsize(path)
+        if total > ZIP_CACHE_BYTES:
+            try: os.remove(path)
+            except OSError: pass
+
+def splice_zip_entries(dst_zf, src_path, prefix):
+    # 이미 deflate 된 데이터를 압축 해제 없이 그대로 복사하고 로컬 헤더만 새 이름(prefix/...)으로 다시 씀
+    with open(src_path, "rb") as src, zipfile.ZipFile(src) as src_zf:
+        for info in src_zf.infolist():
+            src.seek(info.header_offset)
+            header = struct.unpack(zipfile.structFileHeader, src.read(zipfile.sizeFileHeader))
+            src.seek(header[10] + header[11], os.SEEK_CUR)  # 파일명 길이 + extra 길이
+            entry = copy.copy(info)
+            entry.filename = entry.orig_filename = prefix + info.filename
+            entry.extra = b""
+            entry.flag_bits &= ~0x08  # 크기/CRC 는 로컬 헤더에 바로 기록
+            entry.header_offset = dst_zf.fp.tell()
+            zip64 = max(entry.file_size, entry.compress_size) > zipfile.ZIP64_LIMIT
+            dst_zf.fp.write(entry.FileHeader(zip64))
+            remaining = info.compress_size
+            while remaining:
+                chunk = src.read(min(STREAM_CHUNK, remaining))
+                if not chunk: raise zipfile.BadZipFile(f"잘린 캐시 파일: {src_path}")
+                dst_zf.fp.write(chunk)
+                remaining -= len(chunk)
+            dst_zf.filelist.append(entry)
+            dst_zf.NameToInfo[entry.filename] = entry
+            dst_zf.start_dir = dst_zf.fp.tell()
+
+def new_folder_name(title):
+    # 저장소 폴더명: <제목에서 영숫자/한글만>_<랜덤 8자리 hex>
+    safe_title = "".join(x for x in title if x.isalnum())
+    return f"{safe_title}_{os.urandom(4).hex()}"
+
+def zip_folder_name(res):
+    return re.sub(r'[\\/:*?"<>|]', '_', res.get('title', 'Untitled'))
+
+def download_zip(selected_objs):
+    # 📌 리소스별 캐시 ZIP 을 만들어 두고(없을 때만 병렬 blob 다운로드), 최종 ZIP 은 압축 엔트리를 이어붙여 생성
+    repo = get_repo()
+    head_sha = get_head_sha(repo)
+    folder_shas = {e.path: e.sha for e in gh(repo.get_git_tree, f"{head_sha}:{UPLOAD_DIR}").tree if e.type == "tree"}
+
+    zip_file = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_BYTES)
+    with get_metrics().timer("zip_download"), zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zf:
+        for res in selected_objs:
+            if res['id'] not in folder_shas: continue
+            splice_zip_entries(zf, get_resource_zip(repo, folder_shas[res['id']]), f"{zip_folder_name(res)}/")
+    zip_file.seek(0)
+    return zip_file
+
+def warm_resource_zips(ids):
+    # 지정한 리소스의 ZIP 캐시를 현재 HEAD 기준으로 미리 만들어 둠 (이미 있으면 건너뜀) -> 새로 만든 개수
+    if not ids: return 0
+    repo = get_repo()
+    folder_shas = {e.path: e.sha for e in gh(repo.get_git_tree, f"{get_head_sha(repo)}:{UPLOAD_DIR}", bulk=True).tree if e.type == "tree"}
+    built = 0
+    for rid in ids:
+        if rid in folder_shas and not os.path.exists(resource_zip_path(folder_shas[rid])):
+            get_resource_zip(repo, folder_shas[rid])
+            built += 1
+    return built
+
+def get_openai_client():
+    return OpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL, timeout=DESC_TIMEOUT, max_retries=0)
+
+# 📌 [복구 완료] 선생님이 주신 완벽한 프롬프트 적용
+def build_desc_prompt(file_contents_str, hint):
+    return f"""
+    당신은 기업의 수석 IT 컨설턴트입니다. 
+    사용자가 업로드한 '파일의 실제 내용'을 분석하여 임원 및 실무자 보고용 문서를 작성하세요.
+    
+    [분석할 파일 내용]:
+    {file_contents_str}
+    
+    [작성자 힌트]: 
+    {hint}
+    
+    **작성 가이드:**
+    1. 서론(안녕하세요 등) 절대 금지. 바로 본론 진입.
+    2. 전문적인 비즈니스 용어 사용.
+    3. 화살표(->)를 사용하여 데이터 흐름을 명확히 표현.
+    4. 언어: 한국어 (Korean)
+    
+    **출력 포맷 (Markdown):**
+    
+    ### 📋 시스템 요약 (Executive Summary)
+    (이 도구가 무엇인지, 어떤 비즈니스 가치를 주는지 2줄 요약)
+
+    ### ⚙️ 아키텍처 및 데이터 흐름
+    * **Flow**: `[입력] -> [처리] -> [출력]` (실제 로직 반영)
+    * **핵심 구성 요소**:
+        * **파일명**: (해당 파일의 구체적 역할과 로직 설명)
+
+    ### 🛠️ 기술적 메커니즘 (Deep Dive)
+    * **트리거**: (언제 실행되는지)
+    * **로직**: (데이터가 어떻게 가공되는지 코드 레벨 분석)
+
+    ### ✨ 비즈니스 임팩트
+    (도입 시 정량적/정성적 기대 효과)
+    """
+
+def generate_desc(file_contents_str, hint, usage=None):
+    # 실패(타임아웃 포함)는 예외로 올림 -> 재시도 여부는 호출하는 쪽(DescriptionJobs)이 결정
+    if not OPENAI_API_KEY: return "API 키가 설정되지 않았습니다."
+    client = get_openai_client()
+    prompt = build_desc_prompt(file_contents_str, hint)
+    with get_metrics().timer("openai_request", mode="complete"):
+        res = client.chat.completions.create(model=OPENAI_MODEL, messages=[{"role":"user","content":prompt}])
+    if res.usage: get_metrics().inc("openai_tokens_total", res.usage.total_tokens, mode="complete")
+    if usage is not None and res.usage: usage["total_tokens"] = usage.get("total_tokens", 0) + res.usage.total_tokens
+    return res.choices[0].message.content
+
+def stream_desc(file_contents_str, hint, stats):
+    # 📌 스트리밍 모드: 토큰이 도착하는 대로 조각(str)을 yield, stats 에 ttft / elapsed / total_tokens 기록
+    client, metrics = get_openai_client(), get_metrics()
+    started = time.perf_counter()
+    with metrics.timer("openai_request", mode="stream"):
+        stream = client.chat.completions.create(
+            model=OPENAI_MODEL, messages=[{"role":"user","content":build_desc_prompt(file_contents_str, hint)}],
+            stream=True, stream_options={"include_usage": True})
+        for chunk in stream:
+            if chunk.usage:
+                stats["total_tokens"] = stats.get("total_tokens", 0) + chunk.usage.total_tokens
+                metrics.inc("openai_tokens_total", chunk.usage.total_tokens, mode="stream")
+            if not chunk.choices or not chunk.choices[0].delta.content: continue
+            if "ttft" not in stats:
+                stats["ttft"] = time.perf_counter() - started
+                metrics.observe("openai_ttft_seconds", stats["ttft"])
+            yield chunk.choices[0].delta.content
+    stats["elapsed"] = time.perf_counter() - started
+
+def estimate_tokens(text):
+    # tiktoken 없이 쓰는 근사치: 영문 ~4바이트/토큰, 한글(3바이트) ~1토큰/글자
+    return len(text.encode("utf-8")) // 3 + 1
+
+def truncate_to_tokens(text, tokens):
+    if estimate_tokens(text) <= tokens: return text
+    return text.encode("utf-8")[:tokens * 3].decode("utf-8", "ignore") + "\n...(생략)"
+
+SIGNATURE_RE = re.compile(
+    r"^\s*(?:export\s+)?(?:async\s+)?(?:function\s*\*?\s*\w+\s*\(.*|class\s+\w+.*|def\s+\w+\s*\(.*"
+    r"|(?:const|let|var)\s+\w+\s*=\s*(?:async\s*)?(?:function\b.*|\(.*\)\s*=>.*|\w+\s*=>.*)"
+    r"|(?:const|let|var)\s+[A-Z_][A-Z0-9_]+\s*=.*|[A-Z_][A-Z0-9_]+\s*=.*)$", re.M)
+
+def code_signatures(code):
+    # 함수 시그니처/최상위 정의만 추림 (본문보다 먼저 프롬프트에 넣음)
+    return "\n".join(m.group(0).strip().rstrip("{").strip()[:200] for m in SIGNATURE_RE.finditer(code))
+
+def extract_file_content(name, data):
+    # 파일 종류별로 (구조, 본문) 추출 -> 구조는 예산 안에서 항상 우선
+    try: text = data.decode("utf-8")
+    except UnicodeDecodeError: text = None
+    if text is None or "\x00" in text: return f"(바이너리 파일, {len(data):,} bytes)", ""
+    lower = name.lower()
+    if lower.endswith(CODE_EXTENSIONS):
+        return code_signatures(text), text
+    if lower.endswith(MARKUP_EXTENSIONS):
+        scripts = "\n".join(re.findall(r"<script[^>]*>(.*?)</script>", text, re.S | re.I))
+        visible = re.sub(r"<(script|style)[^>]*>.*?</\1>", " ", text, flags=re.S | re.I)
+        visible = " ".join(re.sub(r"<[^>]+>", " ", visible).split())
+        return code_signatures(scripts), (scripts.strip() + "\n[화면 텍스트] " + visible).strip()
+    return "", text
+
+def summarize_file(name, structure, body, usage):
+    # map 단계: 파일 1개를 짧게 요약
+    client = get_openai_client()
+    content = truncate_to_tokens(f"[구조]\n{structure}\n\n[내용]\n{body}", DESC_MAP_FILE_TOKENS)
+    prompt = f"다음은 '{name}' 파일입니다. 이 파일의 역할, 주요 함수, 데이터 흐름을 한국어 개조식 10줄 이내로 요약하세요.\n\n{content}"
+    with get_metrics().timer("openai_request", mode="map"):
+        res = client.chat.completions.create(model=OPENAI_MODEL, messages=[{"role": "user", "content": prompt}], max_tokens=500)
+    if res.usage:
+        get_metrics().inc("openai_tokens_total", res.usage.total_tokens, mode="map")
+        usage["total_tokens"] = usage.get("total_tokens", 0) + res.usage.total_tokens
+    return res.choices[0].message.content
+
+def desc_priority(name):
+    # 프롬프트에 넣는 순서이자 예산 우선순위: 코드 -> 설정 -> 마크업 -> 그 밖(문서 등)
+    lower = name.lower()
+    for rank, extensions in enumerate((CODE_EXTENSIONS, CONFIG_EXTENSIONS, MARKUP_EXTENSIONS)):
+        if lower.endswith(extensions): return rank
+    return 3
+
+def build_desc_input(file_items, usage):
+    # 📌 파일 종류/토큰 예산을 고려한 프롬프트 입력 생성 (업로드 순서와 관계없이 코드 -> 설정 -> 마크업 순)
+    # 예산을 넘치면 코드 구조를 지키는 순서로 줄임: 마크업/문서 본문 자르기 -> 몫보다 큰 파일 요약(map) -> 뒤쪽 파일부터 자르기
+    parts = sorted(((name, *extract_file_content(name, data)) for name, data in file_items), key=lambda p: desc_priority(p[0]))
+    def section(name, structure, body):
+        return f"### {name}\n" + (f"[구조]\n{structure}\n" if structure else "") + (f"[내용]\n{body}" if body else "")
+    def fits():
+        return sum(estimate_tokens(x) for x in sections) <= DESC_INPUT_TOKENS
+    sections = [section(*p) for p in parts]
+    if fits(): return "\n\n".join(sections)
+
+    # 1) 마크업/문서는 본문만 줄이고 구조(스크립트 시그니처)는 유지
+    sections = [section(name, structure, truncate_to_tokens(body, DESC_MARKUP_BODY_TOKENS) if desc_priority(name) >= 2 else body)
+                for name, structure, body in parts]
+    if fits(): return "\n\n".join(sections)
+
+    # 2) 몫보다 큰 파일만 동시에 요약(map) -> 코드 구조는 요약 앞에 그대로 둠
+    share = DESC_INPUT_TOKENS // len(parts)
+    large = [i for i, x in enumerate(sections) if estimate_tokens(x) > share]
+    with ThreadPoolExecutor(max_workers=DESC_MAP_WORKERS) as pool:
+        summaries = pool.map(lambda i: summarize_file(parts[i][0], parts[i][1], parts[i][2], usage), large)
+        for i, summary in zip(large, summaries):
+            name, structure = parts[i][:2]
+            sections[i] = f"### {name} (요약)\n" + (f"[구조]\n{truncate_to_tokens(structure, share // 2)}\n" if structure else "") + summary
+    if fits(): return "\n\n".join(sections)
+
+    # 3) 그래도 넘치면 앞(코드) 파일부터 필요한 만큼 가져가고, 뒤 파일은 남은 예산만 (파일마다 최소 분량은 남김)
+    least, remaining = min(DESC_MIN_SECTION_TOKENS, share), DESC_INPUT_TOKENS
+    for i, x in enumerate(sections):
+        sections[i] = truncate_to_tokens(x, max(least, remaining - least * (len(sections) - i - 1)))
+        remaining -= estimate_tokens(sections[i])
+    return "\n\n".join(sections)
+
+def normalize_file_content(data):
+    # 줄바꿈/줄 끝 공백 차이는 같은 내용으로 취급 (바이너리는 그대로)
+    try: text = data.decode("utf-8")
+    except UnicodeDecodeError: return data
+    return "\n".join(line.rstrip() for line in text.replace("\r\n", "\n").split("\n")).strip().encode("utf-8")
+
+def file_digest(f):
+    # 작은 파일은 정규화한 내용으로, 큰 파일은 원본을 청크 단위로 해시 (전체를 메모리에 올리지 않음)
+    if f.size < LARGE_FILE_BYTES: return hashlib.sha256(normalize_file_content(f.getvalue())).hexdigest()
+    h = hashlib.sha256()
+    f.seek(0)
+    while chunk := f.read(BLOB_UPLOAD_CHUNK): h.update(chunk)
+    f.seek(0)
+    return h.hexdigest()
+
+class StoredFile:
+    # 저장소에서 다시 읽은 파일을 업로드 파일(UploadedFile)과 같은 모양으로 (name / size / read / seek / getvalue)
+    def __init__(self, name, size, fp):
+        self.name, self.size, self.fp = name, size, fp
+
+    def read(self, n=-1):
+        return self.fp.read(n)
+
+    def seek(self, pos, whence=0):
+        return self.fp.seek(pos, whence)
+
+    def getvalue(self):
+        self.fp.seek(0)
+        data = self.fp.read()
+        self.fp.seek(0)
+        return data
+
+    def close(self):
+        self.fp.close()
+
+def stored_desc_inputs(folder_name):
+    # 이미 올라간 리소스 파일로 설명 생성 입력을 다시 만듦 (업로드 때와 같은 샘플/캐시 키, 힌트는 저장하지 않으므로 빈 값)
+    files = get_storage().open_files(folder_name)
+    if not files: raise FileNotFoundError(folder_name)
+    try:
+        file_items, cache_key = desc_inputs(files, "")
+        return file_items, "", cache_key
+    finally:
+        for f in files: f.close()
+
+def trim_partial_utf8(data):
+    # 중간에서 자른 bytes 끝에 걸린 UTF-8 다중 바이트 문자 조각을 버림 (그대로 두면 decode 실패 -> 바이너리로 오판)
+    for i in range(1, min(4, len(data)) + 1):
+        byte = data[-i]
+        if byte < 0x80 or byte >= 0xF8: return data
+        if byte >= 0xC0: return data if i == (2 if byte < 0xE0 else 3 if byte < 0xF0 else 4) else data[:-i]
+    return data
+
+def read_desc_sample(f):
+    # 설명 생성용 입력은 파일당 앞부분 DESC_FILE_BYTES 까지만 (잘린 경우 끝의 깨진 문자는 버림)
+    f.seek(0)
+    data = f.read(DESC_FILE_BYTES)
+    f.seek(0)
+    return trim_partial_utf8(data) if len(data) == DESC_FILE_BYTES else data
+
+def desc_inputs(files, hint):
+    # 업로드 폼/재생성/일괄 등록이 같은 입력과 캐시 키를 쓰도록 -> (file_items, cache_key)
+    return [(f.name, read_desc_sample(f)) for f in files], desc_cache_key([file_digest(f) for f in files], hint)
+
+def desc_cache_key(digests, hint):
+    # 파일 순서/제목과 무관하게 (정규화된 내용 해시, 힌트, 프롬프트 버전, 모델) 로 키 생성
+    digests = sorted(digests)
+    material = json.dumps([digests, (hint or "").strip(), PROMPT_VERSION, OPENAI_MODEL])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+class DescriptionCache:
+    # 📌 생성된 설명의 디스크 LRU 캐시: {CACHE_DIR}/descriptions/{key}.json, 적중 시 mtime 갱신 / 초과분은 오래된 것부터 삭제
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self.lock = threading.Lock()
+        self.stats_path = os.path.join(root, "stats.json")
+        try:
+            with open(self.stats_path, encoding="utf-8") as f: self.stats = json.load(f)
+        except (OSError, ValueError):
+            self.stats = {"hits": 0, "misses": 0, "tokens_saved": 0}
+
+    def _save_stats(self):
+        tmp = f"{self.stats_path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f: json.dump(self.stats, f)
+        os.replace(tmp, self.stats_path)
+
+    def get(self, key):
+        path = os.path.join(self.root, f"{key}.json")
+        with self.lock:
+            try:
+                with open(path, encoding="utf-8") as f: entry = json.load(f)
+                os.utime(path)
+            except (OSError, ValueError):
+                self.stats["misses"] += 1
+                self._save_stats()
+                return None
+            self.stats["hits"] += 1
+            self.stats["tokens_saved"] += entry.get("tokens", 0)
+            self._save_stats()
+            return entry["description"]
+
+    def put(self, key, description, tokens):
+        path = os.path.join(self.root, f"{key}.json")
+        with self.lock:
+            with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+                json.dump({"description": description, "tokens": tokens, "model": OPENAI_MODEL, "prompt_version": PROMPT_VERSION}, f, ensure_ascii=False)
+            os.replace(f"{path}.tmp", path)
+            entries = [os.path.join(self.root, n) for n in os.listdir(self.root) if n.endswith(".json") and n != "stats.json"]
+            if len(entries) > DESC_CACHE_ENTRIES:
+                entries.sort(key=os.path.getmtime)
+                for old in entries[:len(entries) - DESC_CACHE_ENTRIES]:
+                    try: os.remove(old)
+                    except OSError: pass
+
+@st.cache_resource
+def get_description_cache():
+    return DescriptionCache(os.path.join(CACHE_DIR, "descriptions"))
+
+# --- 4. AI 설명 백그라운드 작업 ---
+def write_description(folder_name, description):
+    # 생성된 설명을 info.json 과 매니페스트 미리보기에 커밋 1개로 반영
+    repo = get_repo()
+    info_path = f"{UPLOAD_DIR}/{folder_name}/info.json"
+    latest = {}  # 마지막으로 만든 트리의 카탈로그 항목 (재시도하면 덮어씀)
+    def build_tree(parent):
+        listing = gh(repo.get_git_tree, f"{parent.sha}:{UPLOAD_DIR}").tree
+        info_data = json.loads(gh(repo.get_contents, info_path, ref=parent.sha).decoded_content.decode("utf-8"))
+        info_data['description'] = description
+        info_sha = create_blob(repo, json.dumps(info_data, ensure_ascii=False, indent=4).encode("utf-8"))
+        entry = latest['entry'] = resource_entry(folder_name, info_data, info_sha)
+        item = manifest_item(entry)
+        content = updated_manifest(repo, listing, lambda m: m.__setitem__(folder_name, item))
+        elements = [InputGitTreeElement(info_path, "100644", "blob", sha=info_sha),
+                    InputGitTreeElement(MANIFEST_PATH, "100644", "blob", content=content)]
+        return gh(repo.create_git_tree, elements, parent.tree)
+    commit = commit_tree_changes(repo, f"Describe {folder_name}", build_tree)
+    publish_commit(commit, lambda by_id: by_id.__setitem__(folder_name, latest['entry']))
+
+def describe_files(file_items, hint, cache_key, progress=None):
+    # 📌 설명 캐시 확인 -> 없으면 최대 DESC_RETRIES 번 생성(지수 백오프) 후 캐시에 저장, 마지막 실패는 예외로 올림
+    # 백그라운드 작업과 일괄 등록(tools/import_resources.py)이 같이 씀, progress(**상태) 로 시도 횟수/오류를 알림
+    desc = get_description_cache().get(cache_key)
+    if desc is not None: return desc
+    for attempt in range(1, DESC_RETRIES + 1):
+        if progress: progress(status="생성 중", attempts=attempt)
+        try:
+            usage = {}
+            desc = generate_desc(build_desc_input(file_items, usage), hint, usage)
+            if usage: get_description_cache().put(cache_key, desc, usage["total_tokens"])
+            return desc
+        except Exception as e:
+            if attempt == DESC_RETRIES: raise
+            if progress: progress(error=str(e))
+            time.sleep(2 ** attempt + random.uniform(0, 1))
+
+class DescriptionJobs:
+    # 📌 업로드는 먼저 끝내고(설명은 자리표시 문구), AI 설명은 워커 풀에서 재시도/타임아웃을 걸어 생성 후 info.json 에 기록
+    def __init__(self):
+        self.pool = ThreadPoolExecutor(max_workers=DESC_WORKERS, thread_name_prefix="desc")
+        self.lock = threading.Lock()
+        self.jobs = {}  # 폴더명 -> 상태 dict
+
+    def _update(self, folder_name, **fields):
+        with self.lock: self.jobs[folder_name].update(fields)
+
+    def submit(self, folder_name, title, file_items, hint, cache_key):
+        # file_items: [(파일명, bytes)]
+        self._queue(folder_name, title, lambda: (file_items, hint, cache_key))
+
+    def resume(self, folder_name, title):
+        # 업로드 때의 입력이 없을 때(재시작 후 복구, 실패 후 다시 생성): 저장소에 올라간 파일을 다시 읽어서 생성
+        self._queue(folder_name, title, lambda: stored_desc_inputs(folder_name))
+
+    def recover(self, resources):
+        # 📌 설명이 아직 자리표시 문구인데 이 프로세스에 작업이 없는 리소스 (생성 도중 재시작/재배포) -> 다시 대기열에 넣음
+        with self.lock: known = set(self.jobs)
+        for res in resources:
+            if res.get('preview') == DESC_PLACEHOLDER_PREVIEW and res['id'] not in known: self.resume(res['id'], res.get('title', res['id']))
+
+    def _queue(self, folder_name, title, load_inputs):
+        with self.lock:
+            self.jobs[folder_name] = {"title": title, "status": "대기", "attempts": 0, "error": "", "submitted": time.time(), "finished": None}
+        self.pool.submit(self._run, folder_name, load_inputs)
+
+    def _run(self, folder_name, load_inputs):
+        try: file_items, hint, cache_key = load_inputs()
+        except (UnknownObjectException, FileNotFoundError):
+            self._update(folder_name, status="실패", error="리소스가 삭제되었습니다.", finished=time.time())
+            return
+        except Exception as e:
+            self._update(folder_name, status="실패", error=f"파일 읽기 실패: {e}", finished=time.time())
+            return
+        try: desc = describe_files(file_items, hint, cache_key, lambda **kw: self._update(folder_name, **kw))
+        except Exception as e:
+            self._update(folder_name, status="실패", error=str(e), finished=time.time())
+            return
+        try:
+            self._update(folder_name, status="저장 중")
+            get_storage().write_description(folder_name, desc)
+        except (UnknownObjectException, FileNotFoundError):
+            self._update(folder_name, status="실패", error="리소스가 삭제되었습니다.", finished=time.time())
+            return
+        except Exception as e:
+            self._update(folder_name, status="실패", error=f"저장 실패: {e}", finished=time.time())
+            return
+        self._update(folder_name, status="완료", error="", finished=time.time())
+        get_storage().refresh_in_background()
+        sync_embeddings()
+
+    def snapshot(self):
+        with self.lock:
+            return sorted(({"folder": k, **v} for k, v in self.jobs.items()), key=lambda j: j["submitted"], reverse=True)
+
+@st.cache_resource
+def get_description_jobs():
+    return DescriptionJobs()
+
+def stream_description_preview(file_items, hint, cache_key):
+    # 폼 미리보기 영역에 토큰을 실시간으로 그림 -> 완성된 설명 반환 (실패 시 None: 백그라운드 작업으로 넘김)
+    preview = st.empty()
+    desc = get_description_cache().get(cache_key)
+    if desc is not None:
+        preview.markdown(desc)
+        st.caption("⚡ 설명 캐시 적중 (생성 생략)")
+        return desc
+    stats, text = {}, ""
+    try:
+        with st.spinner("파일 분석 중..."):
+            content = build_desc_input(file_items, stats)
+        for delta in stream_desc(content, hint, stats):
+            text += delta
+            preview.markdown(text + "▌")
+    except Exception as e:
+        st.warning(f"⚠️ 실시간 생성 실패, 백그라운드 생성으로 전환합니다. ({e})")
+        return None
+    preview.markdown(text)
+    if stats.get("total_tokens"): get_description_cache().put(cache_key, text, stats["total_tokens"])
+    st.caption(f"⏱️ 첫 토큰까지 {stats.get('ttft', 0):.2f}초 · 전체 {stats.get('elapsed', 0):.1f}초")
+    return text
+
+def render_description_jobs():
+    stats = get_description_cache().stats
+    lookups = stats["hits"] + stats["misses"]
+    c1, c2, c3 = st.columns(3)
+    c1.metric("설명 캐시 적중", f"{stats['hits']}회", f"{stats['hits'] / lookups:.0%}" if lookups else None)
+    c2.metric("설명 캐시 미스", f"{stats['misses']}회")
+    c3.metric("절약한 토큰", f"{stats['tokens_saved']:,}")
+
+    get_description_jobs().recover(get_storage().catalog()[0])
+    jobs = get_description_jobs().snapshot()
+    if not jobs: return
+    st.markdown("#### 🤖 AI 설명 생성 작업")
+    if st.button("작업 상태 새로고침"): st.rerun()
+    icons = {"대기": "🕒", "생성 중": "⏳", "저장 중": "💾", "완료": "✅", "실패": "❌"}
+    for job in jobs:
+        elapsed = (job["finished"] or time.time()) - job["submitted"]
+        line = f"{icons.get(job['status'], '')} **{job['title']}** · {job['status']} · 시도 {job['attempts']}/{DESC_RETRIES} · {elapsed:.0f}초"
+        if job["error"]: line += f" · {job['error']}"
+        c_line, c_retry = st.columns([5, 1])
+        c_line.write(line)
+        if job["status"] == "실패" and job["error"] != "리소스가 삭제되었습니다." and c_retry.button("다시 생성", key=f"desc_retry_{job['folder']}"):
+            get_description_jobs().resume(job["folder"], job["title"])
+            st.rerun()
+
+# --- 5. 저장소 백엔드 ---
+class GitHubStorage:
+    # GitHub 저장소(Git Data API) 백엔드: 위의 GitHub 함수들을 같은 인터페이스로 묶음
+    name = "github"
+
+    def catalog(self):
+        # -> (리소스 목록, 버전): 프로세스 공용 목록을 그대로 돌려줌 (세션은 복사하지 않고 참조만), 버전은 검색 색인 캐시 키로도 쓰임
+        return get_catalog_cache().get()
+
+    def refresh(self):
+        get_catalog_cache().revalidate()
+
+    def refresh_in_background(self):
+        get_catalog_cache().revalidate_in_background()
+
+    def description(self, res, bulk=False):
+        return get_description(res, bulk)
+
+    def upload(self, folder_name, files, meta_data):
+        return upload_to_github(folder_name, files, meta_data)
+
+    def delete(self, folder_path):
+        return delete_from_github(folder_path)
+
+    def zip(self, selected_objs):
+        return download_zip(selected_objs)
+
+    def warm(self, ids):
+        return warm_resource_zips(ids)
+
+    def open_files(self, folder_name):
+        # info.json 을 뺀 리소스 파일들 (중첩 폴더 포함) -> [StoredFile], 닫는 것은 호출한 쪽
+        repo = get_repo()
+        jobs = list_tree_files(repo, f"{get_head_sha(repo)}:{UPLOAD_DIR}/{folder_name}")
+        return [StoredFile(path, size, fetch_raw_blob(sha)) for path, sha, size in jobs]
+
+    def write_description(self, folder_name, description):
+        write_description(folder_name, description)
+
+def write_mmap_entry(zf, path, arcname):
+    # 파일을 메모리 매핑해서 그대로 압축기에 넘김 (파이썬 bytes 복사본 없이 페이지 캐시에서 바로 읽음)
+    info = zipfile.ZipInfo.from_file(path, arcname)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    with open(path, "rb") as f:
+        if info.file_size == 0: return zf.writestr(info, b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm: zf.writestr(info, mm)
+
+class LocalStorage:
+    # 📌 로컬 디스크 백엔드: 폴더 구조(resources/<id>/{info.json, 파일...})는 GitHub 와 같고, 카탈로그 메타데이터는 SQLite 에 보관
+    # info.json 도 계속 기록하므로 DB 는 디스크에서 언제든 다시 만들 수 있음 (scan: info.json mtime 이 바뀐 폴더만 다시 읽음)
+    name = "local"
+    COLUMNS = "id, title, category, preview, terms, files, info_sha"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS resources (
+            id TEXT PRIMARY KEY, title TEXT, category TEXT, description TEXT, preview TEXT,
+            files TEXT, info_sha TEXT, info_mtime INTEGER, updated_at REAL, terms TEXT);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER);
+        CREATE TABLE IF NOT EXISTS mirror_queue (id TEXT PRIMARY KEY, queued_at REAL);
+        INSERT OR IGNORE INTO meta (key, value) VALUES ('version', 0);
+    """
+
+    def __init__(self, root, db_path):
+        self.root = root
+        self.base = os.path.join(root, UPLOAD_DIR)
+        os.makedirs(self.base, exist_ok=True)
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.lock = threading.RLock()  # 연결 1개를 스레드들이 나눠 쓰므로 모든 DB 접근은 이 락 안에서
+        self.db = sqlite3.connect(db_path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(self.SCHEMA)
+        if "terms" not in {row[1] for row in self.db.execute("PRAGMA table_info(resources)")}:
+            # 검색어(terms) 열이 없던 예전 DB -> 열을 추가하고 다음 scan 에서 모든 info.json 을 다시 읽게 함
+            with self.db: self.db.execute("ALTER TABLE resources ADD COLUMN terms TEXT"); self.db.execute("UPDATE resources SET info_mtime = NULL")
+        self.mirror = None
+        self.cached = (None, [])
+        self.scan()
+
+    def _version(self):
+        return self.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()[0]
+
+    def _changed(self, folder_name):
+        # 트랜잭션 안에서 호출: 카탈로그 버전 올리고 미러링 대기열에 추가
+        self.db.execute("UPDATE meta SET value = value + 1 WHERE key = 'version'")
+        if self.mirror: self.db.execute("INSERT OR REPLACE INTO mirror_queue (id, queued_at) VALUES (?, ?)", (folder_name, time.time()))
+
+    def _upsert(self, folder_name, info_data, raw, mtime):
+        info_sha = hashlib.sha1(f"blob {len(raw)}\0".encode("ascii") + raw).hexdigest()
+        res = resource_entry(folder_name, dict(info_data), info_sha)
+        self.db.execute("INSERT OR REPLACE INTO resources (id, title, category, description, preview, files, info_sha, info_mtime, updated_at, terms) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (folder_name, res.get('title', ''), res.get('category'), info_data.get('description', ''), res['preview'],
+                         json.dumps(res.get('files', []), ensure_ascii=False), info_sha, mtime, time.time(), res['terms']))
+
+    def _write_info(self, folder_name, info_data):
+        # info.json 을 임시 파일에 쓰고 교체 -> (내용 bytes, mtime)
+        path = os.path.join(self.base, folder_name, "info.json")
+        raw = json.dumps(info_data, ensure_ascii=False, indent=4).encode("utf-8")
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f: f.write(raw)
+        os.replace(tmp, path)
+        return raw, os.stat(path).st_mtime_ns
+
+    def scan(self):
+        # 디스크와 DB 맞추기: 새로 생기거나 info.json 이 바뀐 폴더는 읽어서 반영, 사라진 폴더는 삭제
+        with self.lock:
+            known = dict(self.db.execute("SELECT id, info_mtime FROM resources"))
+            seen, changed = set(), False
+            with self.db:
+                for folder_name in os.listdir(self.base):
+                    if folder_name.startswith("."): continue
+                    path = os.path.join(self.base, folder_name, "info.json")
+                    try: mtime = os.stat(path).st_mtime_ns
+                    except OSError: continue
+                    seen.add(folder_name)
+                    if known.get(folder_name) == mtime: continue
+                    try:
+                        with open(path, "rb") as f: raw = f.read()
+                        self._upsert(folder_name, json.loads(raw.decode("utf-8")), raw, mtime)
+                    except (OSError, ValueError): continue
+                    changed = True
+                for folder_name in set(known) - seen:
+                    self.db.execute("DELETE FROM resources WHERE id = ?", (folder_name,))
+                    changed = True
+                if changed: self.db.execute("UPDATE meta SET value = value + 1 WHERE key = 'version'")
+
+    @staticmethod
+    def _entry(row):
+        rid, title, cat, preview, terms, files, info_sha = row
+        return resource_entry(rid, {"title": title, "category": cat, "preview": preview, "terms": terms or "", "files": json.loads(files)}, info_sha)
+
+    def catalog(self):
+        with self.lock:
+            version = self._version()
+            if self.cached[0] != version:
+                with get_metrics().timer("catalog_load", mode="local"):
+                    rows = self.db.execute(f"SELECT {self.COLUMNS} FROM resources ORDER BY title DESC").fetchall()
+                    self.cached = (version, [self._entry(row) for row in rows])
+            return self.cached[1], f"local:{version}"
+
+    def _publish(self, folder_name):
+        # 쓰기 직후 (락 안에서): 캐시 목록이 직전 버전이면 바뀐 폴더 1개만 다시 읽어 새 목록으로 교체
+        # 그보다 오래된 목록이면 다음 catalog() 가 전체를 다시 읽음
+        version = self._version()
+        if self.cached[0] != version - 1: return
+        row = self.db.execute(f"SELECT {self.COLUMNS} FROM resources WHERE id = ?", (folder_name,)).fetchone()
+        by_id = {r['id']: r for r in self.cached[1]}
+        if row: by_id[folder_name] = self._entry(row)
+        else: by_id.pop(folder_name, None)
+        self.cached = (version, sorted(by_id.values(), key=lambda x: x.get('title', ''), reverse=True))
+
+    def refresh(self):
+        self.scan()
+
+    def refresh_in_background(self):
+        pass  # 쓰기와 동시에 버전이 올라가므로 다시 읽을 것이 없음
+
+    def description(self, res, bulk=False):
+        with self.lock:
+            row = self.db.execute("SELECT description FROM resources WHERE id = ?", (res['id'],)).fetchone()
+        return row[0] if row else ''
+
+    def folder_files(self, folder_name):
+        # 폴더 기준 상대경로("/" 구분) 목록, 중첩 폴더 포함
+        folder = os.path.join(self.base, folder_name)
+        paths = []
+        for dirpath, _, names in os.walk(folder):
+            rel_dir = os.path.relpath(dirpath, folder)
+            paths += [name if rel_dir == "." else f"{rel_dir.replace(os.sep, '/')}/{name}" for name in names]
+        return sorted(paths)
+
+    def upload(self, folder_name, files, meta_data):
+        # 임시 폴더에 다 쓴 뒤 이름만 바꿔서 반영 -> 중간 실패 시 info.json 없는 폴더가 남지 않음
+        tmp = os.path.join(self.base, f".{folder_name}.{threading.get_ident()}.tmp")
+        os.makedirs(tmp)
+        try:
+            for f in files:
+                f.seek(0)
+                with open(os.path.join(tmp, f.name), "wb") as dst: shutil.copyfileobj(f, dst, STREAM_CHUNK)
+            os.replace(tmp, os.path.join(self.base, folder_name))
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        with self.lock:
+            with self.db:
+                self._upsert(folder_name, meta_data, *self._write_info(folder_name, meta_data))
+                self._changed(folder_name)
+            self._publish(folder_name)
+        if self.mirror: self.mirror.wake.set()
+        return {"skipped_files": 0, "skipped_bytes": 0}
+
+    def delete(self, folder_path):
+        folder_name = folder_path.rsplit("/", 1)[-1]
+        folder = os.path.join(self.base, folder_name)
+        if not os.path.isdir(folder): raise FileNotFoundError(folder_path)
+        removed = self.folder_files(folder_name)
+        shutil.rmtree(folder)
+        with self.lock:
+            with self.db:
+                self.db.execute("DELETE FROM resources WHERE id = ?", (folder_name,))
+                self._changed(folder_name)
+            self._publish(folder_name)
+        if self.mirror: self.mirror.wake.set()
+        return removed
+
+    def zip(self, selected_objs):
+        # 캐시 없이 디스크에서 바로 압축 (파일은 mmap 으로 읽음)
+        zip_file = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_BYTES)
+        with get_metrics().timer("zip_download"), zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zf:
+            for res in selected_objs:
+                if not os.path.isdir(os.path.join(self.base, res['id'])): continue
+                for rel in self.folder_files(res['id']):
+                    if rel == "info.json": continue
+                    write_mmap_entry(zf, os.path.join(self.base, res['id'], *rel.split("/")), f"{zip_folder_name(res)}/{rel}")
+        zip_file.seek(0)
+        return zip_file
+
+    def warm(self, ids):
+        return 0  # 파일이 이미 로컬 디스크에 있으므로 미리 받을 것이 없음
+
+    def open_files(self, folder_name):
+        paths = [(rel, os.path.join(self.base, folder_name, *rel.split("/"))) for rel in self.folder_files(folder_name) if rel != "info.json"]
+        return [StoredFile(rel, os.path.getsize(path), open(path, "rb")) for rel, path in paths]
+
+    def write_description(self, folder_name, description):
+        with self.lock:
+            with open(os.path.join(self.base, folder_name, "info.json"), encoding="utf-8") as f: info_data = json.load(f)
+            info_data['description'] = description
+            with self.db:
+                self._upsert(folder_name, info_data, *self._write_info(folder_name, info_data))
+                self._changed(folder_name)
+            self._publish(folder_name)
+        if self.mirror: self.mirror.wake.set()
+
+    def mirror_pending(self):
+        with self.lock: return self.db.execute("SELECT id, queued_at FROM mirror_queue ORDER BY queued_at").fetchall()
+
+    def mirror_done(self, folder_name, queued_at):
+        # 미러링하는 사이 다시 바뀌었으면(queued_at 이 달라짐) 대기열에 남겨둠
+        with self.lock, self.db: self.db.execute("DELETE FROM mirror_queue WHERE id = ? AND queued_at = ?", (folder_name, queued_at))
+
+class GitHubMirror:
+    # 📌 local 백엔드의 변경분을 GitHub 로 비동기 반영 (대기열은 SQLite 에 있으므로 재시작해도 이어서 처리)
+    # 폴더 단위로 디스크 상태를 그대로 올림: 폴더 트리를 새로 만들어 resources/<id> 를 교체 + 매니페스트 갱신, 폴더가 없으면 삭제
+    def __init__(self, storage):
+        self.storage = storage
+        self.wake = threading.Event()
+        threading.Thread(target=self._loop, daemon=True, name="github-mirror").start()
+
+    def _loop(self):
+        metrics = get_metrics()
+        while True:
+            pending = self.storage.mirror_pending()
+            metrics.set_gauge("mirror_queue_depth", len(pending))
+            failed = False
+            for folder_name, queued_at in pending:
+                try:
+                    with metrics.timer("mirror_push"): self.push(folder_name)
+                    self.storage.mirror_done(folder_name, queued_at)
+                except Exception as e:
+                    metrics.log("mirror_error", folder=folder_name, error=str(e))
+                    failed = True
+                    break
+            if failed: self.wake.wait(MIRROR_RETRY_SECONDS)
+            elif not pending: self.wake.wait()
+            self.wake.clear()
+
+    def push(self, folder_name):
+        repo = get_repo()
+        folder = os.path.join(self.storage.base, folder_name)
+        if not os.path.isdir(folder):
+            try: delete_from_github(f"{UPLOAD_DIR}/{folder_name}")
+            except UnknownObjectException: pass  # 이미 없음
+            return
+        head_sha = get_head_sha(repo)
+        try: known = known_blob_shas(head_sha)
+        except UnknownObjectException: known = frozenset()
+        elements, info_sha = [], None
+        for rel in self.storage.folder_files(folder_name):
+            with open(os.path.join(folder, *rel.split("/")), "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                sha = git_blob_sha(f, size)
+                if sha not in known:
+                    sha = create_blob(repo, f.read()) if size < LARGE_FILE_BYTES else stream_blob(f, size, lambda n: None)
+            if rel == "info.json": info_sha = sha
+            elements.append(InputGitTreeElement(rel, "100644", "blob", sha=sha))
+        if info_sha is None: return  # 아직 쓰는 중인 폴더
+        tree = gh(repo.create_git_tree, elements)
+        try: listing = gh(repo.get_git_tree, f"{head_sha}:{UPLOAD_DIR}").tree
+        except UnknownObjectException: listing = []
+        if any(e.path == folder_name and e.sha == tree.sha for e in listing): return  # GitHub 쪽이 이미 같음
+
+        with open(os.path.join(folder, "info.json"), encoding="utf-8") as f: item = manifest_item(resource_entry(folder_name, json.load(f), info_sha))
+        def build_tree(parent):
+            try: listing = gh(repo.get_git_tree, f"{parent.sha}:{UPLOAD_DIR}").tree
+            except UnknownObjectException: listing = []
+            content = updated_manifest(repo, listing, lambda m: m.__setitem__(folder_name, item))
+            return gh(repo.create_git_tree, [InputGitTreeElement(f"{UPLOAD_DIR}/{folder_name}", "040000", "tree", sha=tree.sha),
+                                             InputGitTreeElement(MANIFEST_PATH, "100644", "blob", content=content)], parent.tree)
+        commit_tree_changes(repo, f"Mirror {folder_name}", build_tree)
+
+@st.cache_resource
+def get_storage():
+    # 📌 Secrets [general] storage_backend 로 선택 ("github" 기본 / "local")
+    if STORAGE_BACKEND != "local": return GitHubStorage()
+    storage = LocalStorage(LOCAL_STORAGE_DIR, LOCAL_DB_PATH)
+    if MIRROR_TO_GITHUB:
+        storage.mirror = GitHubMirror(storage)
+        storage.mirror.wake.set()
+    return storage
+
+class DownloadStats:
+    # 리소스별 ZIP 다운로드 횟수 (캐시 폴더의 downloads.json 에 보관 -> 재시작해도 인기 순위 유지)
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        try:
+            with open(path, encoding="utf-8") as f: self.counts = defaultdict(int, json.load(f))
+        except (OSError, ValueError):
+            self.counts = defaultdict(int)
+
+    def record(self, ids):
+        with self.lock:
+            for rid in ids: self.counts[rid] += 1
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path + ".tmp", "w", encoding="utf-8") as f: json.dump(self.counts, f)
+            os.replace(self.path + ".tmp", self.path)
+
+    def top(self, n):
+        with self.lock: return sorted(self.counts, key=lambda rid: (-self.counts[rid], rid))[:n]
+
+@st.cache_resource
+def get_download_stats():
+    return DownloadStats(os.path.join(CACHE_DIR, "downloads.json"))
+
+class CacheWarmer:
+    # 📌 요청 경로 밖에서 캐시를 데워 두는 백그라운드 스레드 (프로세스당 1개)
+    # 주기마다 브랜치 HEAD 를 확인(GitHub: ETag 재검증, 변경 없으면 304 / local: mtime 스캔)하고,
+    # 바뀌었으면 카탈로그를 다시 만든 뒤 임베딩 갱신 + 다운로드 많은 리소스의 ZIP 캐시를 미리 채움
+    # 화면 실행(touch)이 WARM_IDLE_SECONDS 동안 없으면 폴링을 멈추고, 다음 실행 때 다시 시작
+    def __init__(self, interval=WARM_INTERVAL_SECONDS):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.thread = None
+        self.last_seen = 0.0
+        self.last_poll = None
+        self.version = None
+
+    def touch(self):
+        if self.interval <= 0: return
+        with self.lock:
+            self.last_seen = time.time()
+            if self.thread is not None: return
+            self.thread = threading.Thread(target=self._run, daemon=True, name="cache-warmer")
+            self.thread.start()
+
+    def running(self):
+        return self.thread is not None
+
+    def _run(self):
+        while True:
+            with self.lock:
+                if time.time() - self.last_seen > WARM_IDLE_SECONDS:
+                    self.thread = None
+                    get_metrics().log("cache_warmer_stopped", idle_seconds=WARM_IDLE_SECONDS)
+                    return
+            try: self.poll()
+            except Exception as e:
+                get_metrics().inc("cache_warmer_polls_total", result="error")
+                get_metrics().log("cache_warmer_failed", error=str(e))
+            time.sleep(self.interval)
+
+    def poll(self):
+        storage = get_storage()
+        with get_metrics().timer("cache_warmer_poll"):
+            storage.refresh()
+            resources, version = storage.catalog()
+        self.last_poll = time.time()
+        changed = version != self.version
+        get_metrics().inc("cache_warmer_polls_total", result="changed" if changed else "unchanged")
+        if not changed: return
+        self.version = version
+        if get_embedding_index(): get_embedding_index().sync_if_active(resources, version)
+        with get_metrics().timer("cache_warmer_prefetch"):
+            built = storage.warm(get_download_stats().top(WARM_TOP_RESOURCES))
+        if built: get_metrics().inc("cache_warmer_zips_total", built)
+
+@st.cache_resource
+def get_cache_warmer():
+    return CacheWarmer()
+
+# --- 6. 메인 화면 ---
+def render_performance_panel():
+    # 📈 프로세스 시작 이후 누적 지표 (서버를 재시작하면 초기화)
+    metrics, scheduler = get_metrics(), get_github_scheduler()
+    rows, counters, gauges = metrics.snapshot()
+    by_name = {(r['지표'], r['라벨']): r for r in rows}
+    rerun, per_view = by_name.get(("script_rerun_seconds", "")), by_name.get(("rerun_github_requests", ""))
+
+    c1, c2, c3, c4 = st.columns(4)
+    reset = f"리셋 {time.strftime('%H:%M:%S', time.localtime(scheduler.reset_at))}" if scheduler.reset_at else None
+    c1.metric("GitHub 남은 한도", "-" if scheduler.remaining is None else f"{scheduler.remaining:,}", help=reset)
+    c2.metric("GitHub 요청 수", f"{int(metrics.total('github_requests_total')):,}", help=f"재시도 {int(metrics.total('github_retries_total'))}회")
+    c3.metric("화면 실행 p50 / p95", f"{rerun['p50'] * 1000:,.0f} / {rerun['p95'] * 1000:,.0f} ms" if rerun else "-")
+    c4.metric("화면당 GitHub 요청 p50 / p95", f"{per_view['p50']:.0f} / {per_view['p95']:.0f}" if per_view else "-")
+
+    st.markdown("##### ⏱️ 지연 시간 / 분포")
+    table = []
+    for r in rows:
+        scale, unit = (1000, "ms") if r['지표'].endswith("_seconds") else (1, "")
+        table.append({**r, "단위": unit, **{k: round(r[k] * scale, 2) for k in ("평균", "p50", "p95", "최대")}})
+    if table: st.dataframe(table, use_container_width=True, hide_index=True)
+    else: st.info("아직 기록된 지표가 없습니다.")
+
+    st.markdown("##### 🔢 카운터 / 게이지")
+    values = [{"지표": n, "라벨": ", ".join(f"{k}={v}" for k, v in labels), "값": v} for (n, labels), v in sorted(counters.items()) + sorted(gauges.items())]
+    if values: st.dataframe(values, use_container_width=True, hide_index=True)
+
+    st.caption(f"수집 시작: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(metrics.started_at))} · p50/p95 는 지표별 최근 {METRIC_SAMPLES}건 기준")
+    st.download_button("📥 Prometheus 형식으로 내려받기", metrics.render_prometheus(), "red_drive_metrics.prom", "text/plain")
+    if METRICS_PORT: st.caption(f"스크레이프 주소: http://<서버>:{METRICS_PORT}/metrics")
+    warmer = get_cache_warmer()
+    last_poll = time.strftime('%H:%M:%S', time.localtime(warmer.last_poll)) if warmer.last_poll else "-"
+    st.caption(f"🔥 캐시 워머: {'실행 중' if warmer.running() else '대기'} · 주기 {warmer.interval}초 · 마지막 확인 {last_poll}")
+
+def build_selection_zip(ids):
+    # 저장 버튼을 누른 순간 Streamlit 이 별도 스레드에서 호출 -> 선택 리소스 ZIP bytes
+    # (st.download_button 은 파일 객체 중 BytesIO/BufferedReader 만 받으므로 SpooledTemporaryFile 은 bytes 로 읽어서 넘김)
+    resources, _ = get_storage().catalog()
+    target = [r for r in resources if r['id'] in ids]
+    with get_storage().zip(target) as zip_file: data = zip_file.read()
+    get_download_stats().record(r['id'] for r in target)
+    return data
+
+class SelectionStore:
+    # 세션별 선택 상태: set 기반이라 포함 여부/추가/삭제가 목록 길이와 상관없이 O(1)
+    # generation 은 일괄 선택/해제 때 올려서 체크박스 위젯 키를 바꿈 -> 화면의 체크 상태를 저장소 값으로 다시 그림
+    def __init__(self):
+        self.ids = set()
+        self.generation = 0
+
+    def __contains__(self, rid):
+        return rid in self.ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def set(self, rid, selected):
+        if selected: self.ids.add(rid)
+        else: self.ids.discard(rid)
+
+    def select_all(self, ids):
+        self.ids.update(ids)
+        self.generation += 1
+
+    def clear(self):
+        self.ids.clear()
+        self.generation += 1
+
+    def retain(self, ids):
+        self.ids.intersection_update(ids)
+
+def get_selection():
+    if 'selection' not in st.session_state: st.session_state['selection'] = SelectionStore()
+    return st.session_state['selection']
+
+def checkbox_key(rid):
+    return f"sel_{get_selection().generation}_{rid}"
+
+def on_card_toggle(rid):
+    get_selection().set(rid, st.session_state[checkbox_key(rid)])
+
+@st.fragment
+def search_box():
+    # 📌 검색창만 다시 실행되는 조각: 검색어가 실제로 바뀌었을 때만 결과 목록을 위해 전체 실행
+    c1, c2, c3 = st.columns([4, 2, 1])
+    query = c1.text_input("검색", placeholder="키워드...", label_visibility="collapsed", key="search_query")
+    mode = c2.segmented_control("검색 방식", SEARCH_MODES, default=SEARCH_MODES[0], key="search_mode", label_visibility="collapsed") or SEARCH_MODES[0]
+    if c3.button("🔄 새로고침"):
+        refresh_resources()
+        st.rerun()
+    if query != st.session_state.get('applied_query', query) or mode != st.session_state.get('applied_mode', mode): st.rerun()
+
+def page_params():
+    # URL 쿼리 파라미터 ?page=&size= -> (페이지, 페이지 크기), 잘못된 값은 기본값으로
+    try: size = int(st.query_params.get("size", DEFAULT_PAGE_SIZE))
+    except ValueError: size = DEFAULT_PAGE_SIZE
+    try: page = max(int(st.query_params.get("page", 1)), 1)
+    except ValueError: page = 1
+    return page, size if size in PAGE_SIZES else DEFAULT_PAGE_SIZE
+
+def set_page(page, size=None):
+    st.query_params["page"] = str(page)
+    if size: st.query_params["size"] = str(size)
+
+def on_page_size_change():
+    set_page(1, st.session_state['page_size'])
+
+def render_pager(page, pages, size, total):
+    c_prev, c_info, c_next, c_size = st.columns([1, 2, 1, 1])
+    c_prev.button("◀ 이전", disabled=page <= 1, use_container_width=True, on_click=set_page, args=(page - 1,))
+    first, last = (page - 1) * size + 1, min(page * size, total)
+    c_info.markdown(f"<div style='text-align:center; padding-top:6px;'>{page} / {pages} 페이지 · {first:,}–{last:,} / {total:,}개</div>", unsafe_allow_html=True)
+    c_next.button("다음 ▶", disabled=page >= pages, use_container_width=True, on_click=set_page, args=(page + 1,))
+    if st.session_state.get('page_size') != size: st.session_state['page_size'] = size  # URL 로 들어온 값과 위젯 맞추기
+    c_size.selectbox("페이지 크기", PAGE_SIZES, key="page_size", format_func=lambda n: f"{n}개씩", label_visibility="collapsed", on_change=on_page_size_change)
+
+def render_card_detail(res):
+    # 펼친 카드만: 파일 목록과 설명 본문을 이때 읽어서 그림 (접힌 카드는 아무것도 보내지 않음)
+    with st.container(border=True):
+        files = res.get('files') or []
+        if files: st.caption("📁 " + " · ".join(files))
+        st.markdown(get_storage().description(res) or "내용 없음")
+
+@st.fragment
+def card_grid(matches):
+    # 📌 카드 목록 조각: 체크박스/상세 보기/페이지 이동은 이 조각(+ 안쪽 선택 바)만 다시 그림 (CSS·카탈로그·검색은 건너뜀)
+    # 현재 페이지에 보이는 카드만 만듦 -> 카탈로그가 커져도 화면 1회 비용은 페이지 크기에 비례
+    if not matches:
+        st.info("등록된 리소스가 없습니다.")
+        selection_bar(matches)  # 검색 결과가 없어도 이미 고른 리소스는 받거나 해제할 수 있게
+        return
+    selection = get_selection()
+    page, size = page_params()
+    pages = math.ceil(len(matches) / size)
+    page = min(page, pages)
+    cols = st.columns(2)
+    for idx, res in enumerate(matches[(page - 1) * size:page * size]):
+        with cols[idx % 2]:
+            with st.container():
+                st.markdown(f"""
+                <div class="resource-card">
+                    <div style="font-weight:bold; color:#E63946;">{res.get('category')}</div>
+                    <div class="resource-title">{res.get('title')}</div>
+                    <div class="resource-preview">{res.get('preview', '')}...</div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                c_chk, c_det = st.columns([1, 2])
+                c_chk.checkbox("선택", key=checkbox_key(res['id']), value=res['id'] in selection, on_change=on_card_toggle, args=(res['id'],))
+                if c_det.toggle("상세 보기", key=f"detail_{res['id']}"): render_card_detail(res)
+    render_pager(page, pages, size, len(matches))
+    selection_bar(matches)
+
+@st.fragment
+def selection_bar(matches):
+    # 선택 바 조각: 카드 목록이 다시 그려질 때 같이 갱신, ZIP 만들기는 이 조각만 다시 실행
+    # 일괄 선택/해제는 화면의 체크박스가 모두 바뀌므로 전체 실행
+    selection = get_selection()
+    st.markdown("---")
+    c_info, c_all, c_clear = st.columns([3, 1, 1])
+    c_info.markdown(f"**✅ {len(selection)}개 선택됨** · 현재 결과 {len(matches)}개")
+    if c_all.button("현재 결과 모두 선택", use_container_width=True, disabled=not matches):
+        selection.select_all(r['id'] for r in matches)
+        st.rerun()
+    if c_clear.button("선택 해제", use_container_width=True, disabled=not selection):
+        selection.clear()
+        st.rerun()
+    if not selection: return
+    # 📌 다운로드 버튼 클릭 시 눈송이 효과
+    if st.button("📦 다운로드 (ZIP)", type="primary", use_container_width=True):
+        st.snow()  # ❄️ 눈송이 효과
+        # ZIP 은 저장 버튼을 누를 때만 만들어짐 (지연 다운로드) -> 화면 실행마다 압축본을 메모리에 들고 있지 않음
+        ids = frozenset(selection.ids)
+        st.download_button("💾 파일 저장하기 (Click)", lambda: build_selection_zip(ids), "RedDrive.zip", "application/zip", use_container_width=True, on_click="ignore")
+
+def main():
+    get_cache_warmer().touch()  # 최신 카탈로그/ZIP 캐시는 워머가 요청 밖에서 준비 -> 화면에서는 교체된 목록만 읽음
+    with st.sidebar:
+        st.title("🔴 Red Drive")
+        st.caption(CURRENT_VERSION)
+        st.write("---")
+        menu = st.radio("메뉴 이동", ["🗂️ 리소스 탐색", "⚙️ 관리자 모드"], label_visibility="collapsed")
+
+    if "탐색" in menu:
+        st.title("Red Drive | AI 리소스 센터")
+        
+        # 📌 세션마다 목록을 복사해 두지 않고 매 실행마다 프로세스 공용 카탈로그를 참조 (세션에는 마지막으로 본 버전만)
+        with st.spinner("데이터 로딩 중..."):
+            resources, catalog_version = get_storage().catalog()
+        seen_version = st.session_state.get('catalog_version')
+        if seen_version and seen_version != catalog_version: st.toast("🔄 리소스 목록이 갱신되었습니다.")
+        st.session_state['catalog_version'] = catalog_version
+        
+        st.metric("총 리소스", f"{len(resources)}개")
+        st.divider()
+
+        if seen_version != catalog_version: get_selection().retain(r['id'] for r in resources)  # 삭제된 리소스는 선택에서 제외
+        # 검색어 위젯 값은 실행 시작 시점에 이미 session_state 에 있음 -> 여기서 반영한 값을 검색창 조각이 비교
+        prev = (st.session_state.get('applied_query'), st.session_state.get('applied_mode'))
+        query = st.session_state['applied_query'] = st.session_state.get('search_query', '')
+        mode = st.session_state['applied_mode'] = st.session_state.get('search_mode') or SEARCH_MODES[0]
+        if prev[0] is not None and prev != (query, mode): set_page(1)  # 검색어/방식이 바뀌면 첫 페이지부터
+        search_box()
+        if mode != "키워드" and get_embedding_index() is None:
+            st.warning(f"⚠️ 의미 검색 설정 오류: embedding_provider '{EMBEDDING_PROVIDER}' 는 {', '.join(EMBEDDERS)} 중 하나여야 합니다. 키워드 검색 결과를 표시합니다.")
+            mode = "키워드"
+        if mode != "키워드": get_embedding_index().sync(resources, catalog_version)  # 의미/혼합 검색일 때만, 새/바뀐 리소스 임베딩은 백그라운드에서
+        if mode != "키워드" and get_embedding_index().progress() < len(resources):
+            st.caption(f"🧠 의미 검색 색인 준비 중 ({get_embedding_index().progress():,} / {len(resources):,})")
+        matches = search_resources(resources, catalog_version, query, mode) if query else resources
+        card_grid(matches)
+
+    elif "관리자" in menu:
+        st.title("⚙️ 관리자 모드")
+        pwd = st.text_input("비밀번호", type="password")
+        if pwd == ADMIN_PASSWORD:
+            t1, t2, t3 = st.tabs(["신규 등록", "삭제", "📈 Performance"])
+            with t1:
+                with st.form("upl"):
+                    title = st.text_input("제목 (한글)")
+                    cat = st.selectbox("카테고리", CATEGORIES)
+                    files = st.file_uploader("파일 업로드", accept_multiple_files=True)
+                    hint = st.text_area("AI 힌트")
+                    live = st.checkbox("✍️ AI 설명 실시간 미리보기 (설명을 다 만든 뒤 업로드)")
+                    
+                    if st.form_submit_button("등록"):
+                        if title and files:
+                            file_items, cache_key = desc_inputs(files, hint)
+                            desc = None
+                            if live:
+                                desc = stream_description_preview(file_items, hint, cache_key)
+                            
+                            with st.spinner("업로드 중..."):
+                                meta = {"title":title, "category":cat, "description":desc or DESC_PLACEHOLDER, "files":[f.name for f in files]}
+                                folder_name = new_folder_name(title)
+                                
+                                report = get_storage().upload(folder_name, files, meta)
+                                if desc is None:
+                                    get_description_jobs().submit(folder_name, title, file_items, hint, cache_key)
+                                sync_embeddings()
+                            
+                            if report["skipped_files"]:
+                                st.info(f"♻️ 이미 저장소에 있는 파일 {report['skipped_files']}개 ({report['skipped_bytes'] / 1024:,.1f} KB)는 다시 올리지 않고 재사용했습니다.")
+                            # 📌 업로드 성공 시 풍선 효과
+                            st.balloons() 
+                            if desc is None:
+                                st.success("등록이 완료되었습니다! AI 설명은 백그라운드에서 생성되어 자동으로 반영됩니다.")
+                            else:
+                                st.success("등록이 완료되었습니다!")
+                
+                render_description_jobs()
+
+            with t2:
+                if 'delete_report' in st.session_state: st.success(st.session_state.pop('delete_report'))
+                if st.button("목록 새로고침"): 
+                    refresh_resources()
+                res_list = get_storage().catalog()[0]
+                if res_list:
+                    target = st.selectbox("삭제 대상", [r['title'] for r in res_list])
+                    if st.button("영구 삭제", type="primary"):
+                        tgt = next(r for r in res_list if r['title'] == target)
+                        with st.spinner("삭제 중..."):
+                            try: removed = get_storage().delete(tgt['path'])
+                            except GithubException as e: report_github_error(e)
+                        st.session_state['delete_report'] = f"삭제됨 ({len(removed)}개 파일): " + ", ".join(removed)
+                        st.rerun()
+
+            with t3:
+                render_performance_panel()
+
+if __name__ == "__main__":
+    with track_rerun(): main()
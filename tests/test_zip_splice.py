@@ -0,0 +1,102 @@
+"""splice_zip_entries 왕복 테스트: 리소스별 캐시 ZIP 을 이어붙인 최종 ZIP 이 정상적으로 풀리는지 확인
+
+한글 파일명, 중첩 폴더, 빈 파일, 데이터 디스크립터(0x08)가 붙은 원본을 모두 포함.
+실행: python -m pytest -q tests
+"""
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import zipfile
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOURCES = {
+    "회의록 요약 봇/": {
+        "Code.gs": "function 요약() {\n  return '회의록';\n}\n".encode("utf-8"),
+        "한글 폴더/설명서.md": ("# 설명서\n" + "반복되는 본문 " * 2000).encode("utf-8"),
+        "a/b/c/깊은 파일.py": b"print('nested')\n",
+        "빈파일.txt": b"",
+    },
+    "Data Tool/": {
+        "index.html": b"<html><body>hello</body></html>\n",
+        "sub/빈 폴더 안/empty.json": b"",
+        "random.bin": os.urandom(64 * 1024),  # 압축이 거의 안 되는 데이터
+    },
+}
+
+
+class NonSeekable(io.RawIOBase):
+    # 스트리밍 응답처럼 되감을 수 없는 출력 -> zipfile 이 크기/CRC 를 데이터 디스크립터(0x08)로 뒤에 씀
+    def __init__(self, sink):
+        self.sink = sink
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.sink.write(data)
+
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory):
+    # app.py 는 import 시점에 Secrets 를 읽으므로 임시 작업 폴더에 local 백엔드 설정을 두고 import
+    root = tmp_path_factory.mktemp("app")
+    (root / ".streamlit").mkdir()
+    (root / ".streamlit" / "secrets.toml").write_text(
+        f'[general]\nstorage_backend = "local"\nopenai_api_key = ""\ncache_dir = "{(root / "cache").as_posix()}"\n'
+        f'local_storage_dir = "{(root / "storage").as_posix()}"\n', encoding="utf-8")
+    cwd = os.getcwd()
+    os.chdir(root)
+    sys.path.insert(0, REPO_ROOT)
+    try:
+        import app as module
+        yield module
+    finally:
+        sys.path.remove(REPO_ROOT)
+        os.chdir(cwd)
+
+
+def write_source_zip(path, files, streaming=False):
+    # 앱의 리소스 캐시 ZIP 과 같은 방식(zf.open(info, "w"), deflate)으로 원본 ZIP 생성
+    with open(path, "wb") as f:
+        target = NonSeekable(f) if streaming else f
+        with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, data in files.items():
+                info = zipfile.ZipInfo(name, date_time=(2024, 1, 2, 3, 4, 6))
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.file_size = len(data)
+                with zf.open(info, "w") as dst: dst.write(data)
+
+
+@pytest.mark.parametrize("streaming", [False, True], ids=["seekable", "data-descriptor"])
+def test_splice_round_trip(app, tmp_path, streaming):
+    out = tempfile.SpooledTemporaryFile(max_size=1024)  # download_zip 과 같이 넘치면 디스크로 가는 임시 파일
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        for i, (prefix, files) in enumerate(SOURCES.items()):
+            src = tmp_path / f"src{i}.zip"
+            write_source_zip(src, files, streaming)
+            app.splice_zip_entries(zf, src, prefix)
+        zf.writestr("마지막/추가.txt", "이어붙인 뒤 일반 기록도 정상".encode("utf-8"))  # 이어붙인 뒤 평소처럼 쓰는 경우
+
+    out.seek(0)
+    expected = {prefix + name: data for prefix, files in SOURCES.items() for name, data in files.items()}
+    expected["마지막/추가.txt"] = "이어붙인 뒤 일반 기록도 정상".encode("utf-8")
+    with zipfile.ZipFile(out) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == list(expected)
+        for info in zf.infolist():
+            assert zf.read(info) == expected[info.filename]
+            assert not info.flag_bits & 0x08  # 크기/CRC 는 로컬 헤더에 바로 기록
+            if not info.filename.isascii(): assert info.flag_bits & 0x800  # UTF-8 파일명 표시
+
+    if shutil.which("unzip"):
+        path = tmp_path / "final.zip"
+        out.seek(0)
+        path.write_bytes(out.read())
+        result = subprocess.run(["unzip", "-t", str(path)], capture_output=True)
+        assert result.returncode == 0, result.stdout.decode("utf-8", "replace") + result.stderr.decode("utf-8", "replace")
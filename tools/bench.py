@@ -0,0 +1,272 @@
+"""성능 벤치마크: 로컬 GitHub 대역 서버 + OpenAI 스텁으로 app.py 의 주요 경로를 측정합니다.
+
+카탈로그(resources/<id>/info.json + 파일, resources/index.json)를 리소스 10 / 1천 / 1만 개로 생성해서
+tools/fake_github.py 에 올리고, app.py 를 실제 설정 경로(.streamlit/secrets.toml 의 github_api_url,
+openai_base_url, cache_dir)로 연결한 뒤 아래 작업을 반복 실행합니다.
+
+    catalog_cold / catalog_revalidate / catalog_incremental   카탈로그 로딩 (전체, ETag 304, diff 동기화)
+    search_build / search_query                               검색 색인 생성 / 질의 (첫 페이지까지)
+    embed_backfill / semantic_query                           임베딩 백필(로컬 hashing 모델) / 의미 검색 질의
+    upload / upload_dedup / delete                            업로드(새 파일 / 이미 있는 파일), 삭제
+    zip_cold / zip_warm                                       선택 다운로드 ZIP (캐시 없음 / 있음)
+    generate_desc / stream_ttft                               AI 설명 생성 / 스트리밍 첫 토큰 시간
+
+작업별로 지연 시간 p50/p95/p99, 1회당 GitHub 요청 수, 최대 메모리(tracemalloc, 별도 1회 측정)를 보고합니다.
+
+    python tools/bench.py                                   # 10, 1000, 10000 개
+    python tools/bench.py --sizes 10,1000 --repeat 5 --save bench-baseline.json
+    python tools/bench.py --compare bench-baseline.json --tolerance 0.25   # 회귀 시 종료 코드 1
+    python tools/bench.py --catalog-dir .                    # 기존 resources/ 폴더를 그대로 사용
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(TOOLS_DIR)
+sys.path.insert(0, TOOLS_DIR)
+
+from fake_github import GitStore, start_fake_github  # noqa: E402
+from openai_stub import StubState, start_stub_server  # noqa: E402
+from memory_file import MemoryFile  # noqa: E402
+
+REPO_NAME = "bench/red-drive"
+WORDS = ["회의록", "아카이빙", "요약", "자동화", "스프레드시트", "채팅", "메일", "보고서", "계산기", "대시보드",
+         "알림", "번역", "분류", "검색", "일정", "정산", "리포트", "크롤러", "백업", "동기화"]
+CATEGORIES = ["Workflow", "Prompt", "Data", "Tool"]
+FILE_KINDS = [("Code.gs", "function {name}() {{\n  var sheet = SpreadsheetApp.getActiveSheet();\n  return sheet.getDataRange().getValues();\n}}\n"),
+              ("Index.html", "<html><body><h1>{name}</h1><script>google.script.run.{name}();</script></body></html>\n"),
+              ("app.py", "import streamlit as st\n\ndef {name}():\n    st.write('{name}')\n")]
+QUERIES = ["회의록", "아카이빙 자동화", "스프레드", "Tool", "Code.gs", "정산 리포트", "없는검색어"]
+LATENCY_METRICS = ("p50_ms", "p95_ms", "mean_ms")
+
+
+# --- 카탈로그 생성 ---
+def generate_catalog(root, count, seed=0):
+    # root/resources/<title>_<hex>/{info.json, 파일들} + resources/index.json (앱이 쓰는 것과 같은 스키마)
+    import app
+    from fake_github import git_hash
+    rng = random.Random(seed)
+    base = os.path.join(root, app.UPLOAD_DIR)
+    os.makedirs(base)
+    manifest = {}
+    for i in range(count):
+        title = " ".join(rng.sample(WORDS, 2)) + f" {i}"
+        folder = f"{''.join(x for x in title if x.isalnum())}_{rng.getrandbits(32):08x}"
+        kinds = rng.sample(FILE_KINDS, rng.randint(1, 3))
+        os.makedirs(os.path.join(base, folder))
+        for name, template in kinds:
+            with open(os.path.join(base, folder, name), "w", encoding="utf-8") as f: f.write(template.format(name=f"run{i}"))
+        description = (f"### 📋 시스템 요약 (Executive Summary)\n{title} 도구입니다. " + " ".join(rng.choices(WORDS, k=40))
+                       + "\n\n### ⚙️ 아키텍처 및 데이터 흐름\n* **Flow**: `[입력] -> [처리] -> [출력]`\n")
+        meta = {"title": title, "category": rng.choice(CATEGORIES), "description": description, "files": [n for n, _ in kinds]}
+        raw = json.dumps(meta, ensure_ascii=False, indent=4).encode("utf-8")
+        with open(os.path.join(base, folder, "info.json"), "wb") as f: f.write(raw)
+        manifest[folder] = app.manifest_item(app.resource_entry(folder, dict(meta), git_hash("blob", raw)))
+    with open(os.path.join(base, "index.json"), "w", encoding="utf-8") as f: f.write(app.manifest_content(manifest))
+
+
+# --- 측정 ---
+def percentile(values, q):
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * q
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(samples, requests, repeat, peak):
+    ms = [s * 1000 for s in samples]
+    return {"n": len(ms), "p50_ms": round(percentile(ms, 0.5), 3), "p95_ms": round(percentile(ms, 0.95), 3),
+            "p99_ms": round(percentile(ms, 0.99), 3), "mean_ms": round(statistics.fmean(ms), 3),
+            "github_requests": round(requests / repeat, 2), "peak_mem_kb": round(peak / 1024, 1)}
+
+
+class Bench:
+    def __init__(self, args, github, stub):
+        self.args, self.github, self.stub = args, github, stub
+        self.results = {}
+
+    def measure(self, label, op, repeat=None, setup=None):
+        # op(i) 를 repeat 번 실행해서 시간/요청 수 측정, 이어서 tracemalloc 으로 1회 더 실행해 최대 메모리 측정
+        repeat = repeat or self.args.repeat
+        samples, requests = [], 0
+        for i in range(repeat + 1):
+            if setup: setup(i)
+            gc.collect()
+            before = self.github.total_requests()
+            if i == repeat: tracemalloc.start()
+            started = time.perf_counter()
+            value = op(i)
+            elapsed = time.perf_counter() - started
+            if i == repeat:
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            else:
+                samples.append(value if isinstance(value, float) else elapsed)
+                requests += self.github.total_requests() - before
+        self.results[label] = summarize(samples, requests, repeat, peak)
+        r = self.results[label]
+        print(f"  {label:<22} p50 {r['p50_ms']:>10.2f} ms  p95 {r['p95_ms']:>10.2f} ms  "
+              f"req {r['github_requests']:>7.1f}  mem {r['peak_mem_kb']:>9.1f} KB", flush=True)
+
+
+def run_size(app, args, github, stub, workspace, label, catalog_dir):
+    store = GitStore.from_directory(catalog_dir)
+    github.store = store
+    bench = Bench(args, github, stub)
+    print(f"\n[{label}] blobs {len(store.blobs):,}, trees {len(store.trees):,}", flush=True)
+    cache_root = os.path.join(workspace, "cache", label)
+
+    # 카탈로그: 빈 캐시에서 전체 로딩 -> 변경 없는 재검증(304) -> 1개 리소스 변경 후 증분 동기화
+    def fresh_cache(i):
+        shutil.rmtree(cache_root, ignore_errors=True)
+        bench.cache = app.CatalogCache(os.path.join(cache_root, f"catalog-{i}"))
+    bench.measure("catalog_cold", lambda i: bench.cache.revalidate(), setup=fresh_cache)
+    cache = app.CatalogCache(os.path.join(cache_root, "catalog"))
+    resources = cache.revalidate()
+    bench.measure("catalog_revalidate", lambda i: cache.revalidate())
+
+    def touch_resource(i):
+        res = resources[i % len(resources)]
+        meta = dict(app.load_resource_info(res["info_sha"]), category=f"Bench{i}")
+        store.commit_files({f"{res['path']}/info.json": json.dumps(meta, ensure_ascii=False, indent=4).encode("utf-8")})
+    bench.measure("catalog_incremental", lambda i: cache.revalidate(), setup=touch_resource)
+    resources = cache.revalidate()
+
+    # 검색
+    index = {}
+    bench.measure("search_build", lambda i: index.__setitem__("idx", app.SearchIndex(resources)))
+    bench.measure("search_query", lambda i: index["idx"]._search(QUERIES[i % len(QUERIES)])[:app.DEFAULT_PAGE_SIZE], repeat=args.repeat * len(QUERIES))
+
+    # 의미 검색: 설명 본문 조회(info.json) + 임베딩 + 행렬 저장, 질의는 질의 벡터 계산 + 코사인 상위 k
+    def fresh_embeddings(i):
+        shutil.rmtree(os.path.join(cache_root, "embeddings"), ignore_errors=True)
+        index["emb"] = app.EmbeddingIndex(os.path.join(cache_root, "embeddings"), app.HashingEmbedder())
+    bench.measure("embed_backfill", lambda i: index["emb"]._sync(resources), repeat=1, setup=fresh_embeddings)
+
+    def semantic_query(i):
+        index["emb"].query_memo.clear()
+        return index["emb"].top_k(QUERIES[i % len(QUERIES)])
+    bench.measure("semantic_query", semantic_query, repeat=args.repeat * len(QUERIES))
+
+    # 업로드 / 중복 업로드 / 삭제
+    def bench_files(i):
+        return [MemoryFile(f"file{n}.py", f"# bench {label} {i} {n}\n".encode("utf-8") + os.urandom(args.upload_bytes))
+                for n in range(args.upload_files)]
+    uploaded, payloads = [], {}
+    def upload(i, dedup=False):
+        folder = f"Bench{'Dedup' if dedup else ''}_{i:04d}_{os.urandom(4).hex()}"
+        files = payloads[i] if dedup else payloads.setdefault(i, bench_files(i))
+        for f in files: f.seek(0)
+        meta = {"title": folder, "category": "Tool", "description": app.DESC_PLACEHOLDER, "files": [f.name for f in files]}
+        app.upload_to_github(folder, files, meta)
+        uploaded.append(folder)
+    bench.measure("upload", upload)
+    bench.measure("upload_dedup", lambda i: upload(i, dedup=True))
+    bench.measure("delete", lambda i: app.delete_from_github(f"{app.UPLOAD_DIR}/{uploaded.pop()}"))
+
+    # ZIP 다운로드: 캐시를 지운 상태 / 리소스별 ZIP 캐시가 있는 상태
+    rng = random.Random(args.seed)
+    selected = rng.sample(resources, min(args.zip_resources, len(resources)))
+    zip_cache = os.path.join(app.CACHE_DIR, "zips")
+    def download(i):
+        with app.download_zip(selected) as f: f.read()
+    bench.measure("zip_cold", download, setup=lambda i: shutil.rmtree(zip_cache, ignore_errors=True))
+    bench.measure("zip_warm", download)
+
+    # AI 설명 (OpenAI 스텁)
+    text = app.build_desc_input([("Code.gs", FILE_KINDS[0][1].format(name="run").encode("utf-8"))], {})
+    bench.measure("generate_desc", lambda i: app.generate_desc(text, "bench"), repeat=min(args.repeat, 5))
+    def ttft(i):
+        stats = {}
+        for _ in app.stream_desc(text, "bench", stats): pass
+        return stats["ttft"]
+    bench.measure("stream_ttft", ttft, repeat=min(args.repeat, 5))
+    return bench.results
+
+
+# --- 기준선 비교 ---
+def compare(results, baseline, tolerance, min_ms):
+    # 지연(p50/p95/mean)이 기준선 x (1 + tolerance) 를 넘거나 요청 수가 늘면 회귀 (min_ms 미만 차이는 무시)
+    regressions = []
+    for size, ops in results["sizes"].items():
+        for op, cur in ops.items():
+            base = baseline.get("sizes", {}).get(size, {}).get(op)
+            if not base: continue
+            for metric in LATENCY_METRICS:
+                if cur[metric] > base[metric] * (1 + tolerance) and cur[metric] - base[metric] > min_ms:
+                    regressions.append(f"{size}/{op} {metric}: {base[metric]:.2f} -> {cur[metric]:.2f} ms")
+            if cur["github_requests"] > base["github_requests"] + 0.5:
+                regressions.append(f"{size}/{op} github_requests: {base['github_requests']} -> {cur['github_requests']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 GitHub/OpenAI 대역 서버로 app.py 성능 측정")
+    parser.add_argument("--sizes", default="10,1000,10000", help="생성할 카탈로그 리소스 수 (쉼표 구분)")
+    parser.add_argument("--catalog-dir", help="생성 대신 사용할 디렉터리 (resources/<id>/info.json 구조)")
+    parser.add_argument("--repeat", type=int, default=10, help="작업별 반복 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--github-latency", type=float, default=0.0, help="GitHub 요청당 추가 지연(초)")
+    parser.add_argument("--openai-latency", type=float, default=0.2, help="OpenAI 비스트리밍 응답 지연(초)")
+    parser.add_argument("--openai-ttft", type=float, default=0.2, help="OpenAI 스트리밍 첫 청크 지연(초)")
+    parser.add_argument("--upload-files", type=int, default=3, help="업로드 1회당 파일 수")
+    parser.add_argument("--upload-bytes", type=int, default=64 * 1024, help="업로드 파일 1개 크기(바이트)")
+    parser.add_argument("--zip-resources", type=int, default=5, help="ZIP 다운로드에 담을 리소스 수")
+    parser.add_argument("--save", help="결과를 기준선 JSON 으로 저장")
+    parser.add_argument("--compare", help="기준선 JSON 과 비교해서 회귀가 있으면 종료 코드 1")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 지연 증가율 (0.2 = 20%%)")
+    parser.add_argument("--min-ms", type=float, default=2.0, help="이보다 작은 지연 차이는 회귀로 보지 않음")
+    args = parser.parse_args()
+    for key in ("save", "compare", "catalog_dir"):
+        if getattr(args, key): setattr(args, key, os.path.abspath(getattr(args, key)))
+
+    workspace = tempfile.mkdtemp(prefix="red-drive-bench-")
+    github, github_url = start_fake_github(GitStore(), REPO_NAME, latency=args.github_latency)
+    stub, openai_url = start_stub_server(StubState(ttft=args.openai_ttft, latency=args.openai_latency, chunk_delay=0.0))
+    os.makedirs(os.path.join(workspace, ".streamlit"))
+    with open(os.path.join(workspace, ".streamlit", "secrets.toml"), "w", encoding="utf-8") as f:
+        f.write(f'[general]\ngithub_token = "bench"\nrepo_name = "{REPO_NAME}"\nopenai_api_key = "bench"\n'
+                f'github_api_url = "{github_url}"\nopenai_base_url = "{openai_url}"\n'
+                f'cache_dir = "{os.path.join(workspace, "cache").replace(os.sep, "/")}"\nbranch = "main"\nlog_level = "WARNING"\n')
+    os.chdir(workspace)  # st.secrets 는 현재 디렉터리의 .streamlit/secrets.toml 을 읽음
+    sys.path.insert(0, REPO_ROOT)
+    import app  # noqa: F401 (설정을 마친 뒤에 import)
+
+    results = {"created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+               "args": {k: v for k, v in vars(args).items() if k not in ("save", "compare")}, "sizes": {}}
+    try:
+        if args.catalog_dir:
+            results["sizes"]["custom"] = run_size(app, args, github, stub, workspace, "custom", args.catalog_dir)
+        for size in [int(s) for s in args.sizes.split(",") if s] if not args.catalog_dir else []:
+            catalog_dir = os.path.join(workspace, f"catalog-{size}")
+            generate_catalog(catalog_dir, size, args.seed)
+            results["sizes"][str(size)] = run_size(app, args, github, stub, workspace, str(size), catalog_dir)
+    finally:
+        github.shutdown()
+        stub.shutdown()
+        os.chdir(REPO_ROOT)
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f: json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n기준선 저장: {args.save}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f: baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance, args.min_ms)
+        print("\n" + ("\n".join(["회귀 발견:"] + [f"  - {r}" for r in regressions]) if regressions else "회귀 없음"))
+        if regressions: sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
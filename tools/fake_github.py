@@ -0,0 +1,387 @@
+"""로컬 GitHub API 대역(stand-in) 서버.
+
+앱이 쓰는 REST 엔드포인트(저장소/브랜치, Git Data API 의 refs·commits·trees·blobs, compare, contents)만
+같은 프로세스 안의 메모리 git 객체 저장소로 흉내 냅니다. blob/tree/commit SHA 는 실제 git 과 같은 방식으로
+계산하므로, 앱이 로컬에서 계산하는 blob SHA(중복 제거)와도 그대로 맞습니다.
+
+    store = GitStore.from_directory("catalog_dir")   # catalog_dir/resources/<id>/info.json ...
+    server, base_url = start_fake_github(store, "owner/repo")
+    # .streamlit/secrets.toml [general] github_api_url = base_url
+
+latency 로 요청마다 왕복 지연을 더할 수 있습니다. 요청 수는 server.counts[(메서드, 경로 이름)] 에 쌓이고, 모든 응답에 X-RateLimit-* 헤더와
+ETag(If-None-Match 이면 304)가 붙습니다.
+"""
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+EMPTY_TREE = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+
+
+def git_hash(kind, data):
+    return hashlib.sha1(f"{kind} {len(data)}\0".encode("ascii") + data).hexdigest()
+
+
+class GitStore:
+    # 메모리 git 객체 저장소: blobs / trees / commits / refs
+    def __init__(self, branch="main"):
+        self.lock = threading.RLock()
+        self.branch = branch
+        self.blobs = {}
+        self.trees = {EMPTY_TREE: []}  # sha -> [(mode, type, name, sha)]
+        self.commits = {}  # sha -> {"tree", "parents", "message"}
+        self.refs = {}
+
+    # --- 객체 생성 ---
+    def put_blob(self, data):
+        sha = git_hash("blob", data)
+        with self.lock: self.blobs[sha] = data
+        return sha
+
+    def put_tree(self, entries):
+        # git 정렬 규칙: 디렉터리는 이름 뒤에 "/" 가 붙은 것처럼 비교
+        entries = sorted(entries, key=lambda e: e[2] + ("/" if e[1] == "tree" else ""))
+        raw = b"".join(f"{'40000' if t == 'tree' else m} {n}".encode("utf-8") + b"\0" + bytes.fromhex(s) for m, t, n, s in entries)
+        sha = git_hash("tree", raw)
+        with self.lock: self.trees[sha] = entries
+        return sha
+
+    def put_commit(self, tree, parents, message):
+        body = f"tree {tree}\n" + "".join(f"parent {p}\n" for p in parents) + f"\n{message}\n{time.time_ns()}"
+        sha = git_hash("commit", body.encode("utf-8"))
+        with self.lock: self.commits[sha] = {"tree": tree, "parents": list(parents), "message": message}
+        return sha
+
+    def tree_from_directory(self, path):
+        entries = []
+        for name in os.listdir(path):
+            full = os.path.join(path, name)
+            if os.path.isdir(full):
+                entries.append(("040000", "tree", name, self.tree_from_directory(full)))
+            else:
+                with open(full, "rb") as f: entries.append(("100644", "blob", name, self.put_blob(f.read())))
+        return self.put_tree(entries)
+
+    @classmethod
+    def from_directory(cls, path, branch="main"):
+        store = cls(branch)
+        store.refs[f"heads/{branch}"] = store.put_commit(store.tree_from_directory(path), [], "Initial catalog")
+        return store
+
+    # --- 조회 ---
+    @property
+    def head(self):
+        return self.refs[f"heads/{self.branch}"]
+
+    def resolve_commit(self, rev):
+        if rev in self.commits: return rev
+        for name in (f"heads/{rev}", rev):
+            if name in self.refs: return self.refs[name]
+        return None
+
+    def resolve_tree(self, treeish):
+        # "<rev>:<경로>", 브랜치 이름, 커밋 SHA, 트리 SHA 를 트리 SHA 로
+        rev, _, path = treeish.partition(":")
+        commit = self.resolve_commit(rev)
+        tree = self.commits[commit]["tree"] if commit else (rev if rev in self.trees else None)
+        for part in [p for p in path.split("/") if p]:
+            if tree is None: return None
+            tree = next((s for m, t, n, s in self.trees[tree] if n == part and t == "tree"), None)
+        return tree
+
+    def lookup(self, tree, path):
+        # 경로 -> (mode, type, sha) / 없으면 None
+        parts = [p for p in path.split("/") if p]
+        entry = ("040000", "tree", tree)
+        for part in parts:
+            if entry[1] != "tree": return None
+            found = next(((m, t, s) for m, t, n, s in self.trees[entry[2]] if n == part), None)
+            if found is None: return None
+            entry = found
+        return entry
+
+    def walk(self, tree, prefix=""):
+        # 재귀 목록: [(경로, mode, type, sha)]
+        out = []
+        for mode, kind, name, sha in self.trees[tree]:
+            path = f"{prefix}{name}"
+            out.append((path, mode, kind, sha))
+            if kind == "tree": out += self.walk(sha, f"{path}/")
+        return out
+
+    def is_ancestor(self, ancestor, commit):
+        stack, seen = [commit], set()
+        while stack:
+            sha = stack.pop()
+            if sha == ancestor: return True
+            if sha in seen or sha not in self.commits: continue
+            seen.add(sha)
+            stack += self.commits[sha]["parents"]
+        return False
+
+    # --- 트리 편집 (POST /git/trees) ---
+    def apply_tree(self, base_tree, items):
+        root = {"entries": {n: (m, t, s) for m, t, n, s in self.trees.get(base_tree, [])}} if base_tree else {"entries": {}}
+
+        def descend(node, name):
+            child = node["entries"].get(name)
+            if isinstance(child, dict): return child
+            entries = {n: (m, t, s) for m, t, n, s in self.trees[child[2]]} if child and child[1] == "tree" else {}
+            node["entries"][name] = {"entries": entries}
+            return node["entries"][name]
+
+        for item in items:
+            parts = item["path"].split("/")
+            node = root
+            for part in parts[:-1]: node = descend(node, part)
+            if "content" in item and item["content"] is not None:
+                node["entries"][parts[-1]] = (item["mode"], "blob", self.put_blob(item["content"].encode("utf-8")))
+            elif item.get("sha") is None:
+                node["entries"].pop(parts[-1], None)
+            else:
+                node["entries"][parts[-1]] = (item["mode"], item["type"], item["sha"])
+
+        def write(node):
+            entries = []
+            for name, value in node["entries"].items():
+                if isinstance(value, dict):
+                    sha = write(value)
+                    if self.trees[sha]: entries.append(("040000", "tree", name, sha))
+                else:
+                    entries.append((value[0], value[1], name, value[2]))
+            return self.put_tree(entries)
+        return write(root)
+
+    def commit_files(self, files, message="Update", deletes=()):
+        # 벤치마크 준비용: {경로: bytes} 를 HEAD 위에 바로 커밋
+        with self.lock:
+            parent = self.head
+            items = [{"path": p, "mode": "100644", "type": "blob", "sha": self.put_blob(d)} for p, d in files.items()]
+            items += [{"path": p, "mode": "100644", "type": "blob", "sha": None} for p in deletes]
+            tree = self.apply_tree(self.commits[parent]["tree"], items)
+            self.refs[f"heads/{self.branch}"] = self.put_commit(tree, [parent], message)
+            return self.head
+
+
+ROUTES = [
+    ("GET", "repo", r""),
+    ("GET", "branch", r"/branches/(?P<name>.+)"),
+    ("GET", "ref", r"/git/refs?/(?P<ref>.+)"),
+    ("PATCH", "ref", r"/git/refs?/(?P<ref>.+)"),
+    ("GET", "commit", r"/git/commits/(?P<sha>[^/]+)"),
+    ("POST", "commit", r"/git/commits"),
+    ("GET", "tree", r"/git/trees/(?P<treeish>.+)"),
+    ("POST", "tree", r"/git/trees"),
+    ("GET", "blob", r"/git/blobs/(?P<sha>[^/]+)"),
+    ("POST", "blob", r"/git/blobs"),
+    ("GET", "compare", r"/compare/(?P<base>.+)\.\.\.(?P<head>.+)"),
+    ("GET", "contents", r"/contents/?(?P<path>.*)"),
+]
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # 헤더/본문을 나눠 쓰므로 지연 ACK 와 맞물려 40ms 씩 멈추지 않도록
+
+    def log_message(self, fmt, *args):
+        pass
+
+    # --- 응답 도우미 ---
+    def _send(self, status, body=b"", content_type="application/json; charset=utf-8", etag=None):
+        server = self.server
+        with server.lock:
+            if status != 304: server.remaining = max(server.remaining - 1, 0)
+            remaining = server.remaining
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-RateLimit-Limit", "5000")
+        self.send_header("X-RateLimit-Remaining", str(remaining))
+        self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+        if etag: self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        etag = f'W/"{hashlib.md5(body).hexdigest()}"' if self.command == "GET" else None
+        if etag and self.headers.get("If-None-Match") == etag: return self._send(304, etag=etag)
+        self._send(status, body, etag=etag)
+
+    def _error(self, status, message):
+        self._json(status, {"message": message, "documentation_url": "https://docs.github.com/rest"})
+
+    # --- 라우팅 ---
+    def _dispatch(self):
+        server = self.server
+        parsed = urllib.parse.urlsplit(self.path)
+        path = urllib.parse.unquote(parsed.path)
+        prefix = f"/repos/{server.repo_name}"
+        if not path.startswith(prefix): return self._error(404, "Not Found")
+        rest = path[len(prefix):]
+        for method, name, pattern in ROUTES:
+            match = re.fullmatch(pattern, rest)
+            if method == self.command and match:
+                with server.lock: server.counts[(method, name)] += 1
+                if server.latency: time.sleep(server.latency)
+                self.query = dict(urllib.parse.parse_qsl(parsed.query))
+                length = int(self.headers.get("Content-Length") or 0)
+                self.body = json.loads(self.rfile.read(length) or b"{}") if length else {}
+                return getattr(self, f"{method.lower()}_{name}")(**match.groupdict())
+        self._error(404, "Not Found")
+
+    def do_GET(self): self._dispatch()
+    def do_POST(self): self._dispatch()
+    def do_PATCH(self): self._dispatch()
+
+    # --- URL / 직렬화 ---
+    def _url(self, rest=""):
+        return f"{self.server.base_url}/repos/{self.server.repo_name}{rest}"
+
+    def _commit_json(self, sha):
+        c = self.server.store.commits[sha]
+        return {"sha": sha, "url": self._url(f"/git/commits/{sha}"), "message": c["message"],
+                "tree": {"sha": c["tree"], "url": self._url(f"/git/trees/{c['tree']}")},
+                "parents": [{"sha": p, "url": self._url(f"/git/commits/{p}")} for p in c["parents"]],
+                "author": {"name": "bench", "email": "bench@example.com", "date": "2024-01-01T00:00:00Z"},
+                "committer": {"name": "bench", "email": "bench@example.com", "date": "2024-01-01T00:00:00Z"}}
+
+    def _tree_json(self, sha, recursive=False):
+        store = self.server.store
+        rows = store.walk(sha) if recursive else [(n, m, t, s) for m, t, n, s in store.trees[sha]]
+        tree = [{"path": p, "mode": m, "type": t, "sha": s, "url": self._url(f"/git/{t}s/{s}"),
+                 **({"size": len(store.blobs[s])} if t == "blob" else {})} for p, m, t, s in rows]
+        return {"sha": sha, "url": self._url(f"/git/trees/{sha}"), "tree": tree, "truncated": False}
+
+    def _ref_json(self, ref):
+        sha = self.server.store.refs[ref]
+        return {"ref": f"refs/{ref}", "url": self._url(f"/git/refs/{ref}"),
+                "object": {"sha": sha, "type": "commit", "url": self._url(f"/git/commits/{sha}")}}
+
+    def _content_json(self, path, mode, kind, sha):
+        store = self.server.store
+        item = {"type": "dir" if kind == "tree" else "file", "name": path.rsplit("/", 1)[-1], "path": path, "sha": sha,
+                "size": len(store.blobs[sha]) if kind == "blob" else 0, "url": self._url(f"/contents/{path}")}
+        return item
+
+    # --- 엔드포인트 ---
+    def get_repo(self):
+        owner, name = self.server.repo_name.split("/")
+        self._json(200, {"id": 1, "name": name, "full_name": self.server.repo_name, "private": True,
+                         "default_branch": self.server.store.branch, "url": self._url(), "owner": {"login": owner}})
+
+    def get_branch(self, name):
+        store = self.server.store
+        sha = store.refs.get(f"heads/{name}")
+        if sha is None: return self._error(404, "Branch not found")
+        commit = self._commit_json(sha)
+        self._json(200, {"name": name, "protected": False, "commit": {"sha": sha, "url": commit["url"], "commit": commit}})
+
+    def get_ref(self, ref):
+        if ref not in self.server.store.refs: return self._error(404, "Not Found")
+        self._json(200, self._ref_json(ref))
+
+    def patch_ref(self, ref):
+        store = self.server.store
+        with store.lock:
+            if ref not in store.refs: return self._error(404, "Not Found")
+            new = self.body["sha"]
+            if new not in store.commits: return self._error(422, "Object does not exist")
+            if not self.body.get("force") and not store.is_ancestor(store.refs[ref], new):
+                return self._error(422, "Update is not a fast forward")
+            store.refs[ref] = new
+        self._json(200, self._ref_json(ref))
+
+    def get_commit(self, sha):
+        if sha not in self.server.store.commits: return self._error(404, "Not Found")
+        self._json(200, self._commit_json(sha))
+
+    def post_commit(self):
+        store = self.server.store
+        if self.body["tree"] not in store.trees: return self._error(422, "Tree SHA does not exist")
+        self._json(201, self._commit_json(store.put_commit(self.body["tree"], self.body.get("parents", []), self.body["message"])))
+
+    def get_tree(self, treeish):
+        sha = self.server.store.resolve_tree(treeish)
+        if sha is None: return self._error(404, "Not Found")
+        self._json(200, self._tree_json(sha, recursive=self.query.get("recursive") not in (None, "0", "false")))
+
+    def post_tree(self):
+        store = self.server.store
+        base = self.body.get("base_tree")
+        if base and base not in store.trees: return self._error(422, "base_tree does not exist")
+        self._json(201, self._tree_json(store.apply_tree(base, self.body.get("tree", []))))
+
+    def get_blob(self, sha):
+        data = self.server.store.blobs.get(sha)
+        if data is None: return self._error(404, "Not Found")
+        if "raw" in (self.headers.get("Accept") or ""):
+            return self._send(200, data, content_type="application/octet-stream")
+        self._json(200, {"sha": sha, "size": len(data), "url": self._url(f"/git/blobs/{sha}"),
+                         "content": base64.b64encode(data).decode("ascii"), "encoding": "base64"})
+
+    def post_blob(self):
+        content = self.body.get("content", "")
+        data = base64.b64decode(content) if self.body.get("encoding") == "base64" else content.encode("utf-8")
+        sha = self.server.store.put_blob(data)
+        self._json(201, {"sha": sha, "url": self._url(f"/git/blobs/{sha}")})
+
+    def get_compare(self, base, head):
+        store = self.server.store
+        base_sha, head_sha = store.resolve_commit(base), store.resolve_commit(head)
+        if not base_sha or not head_sha: return self._error(404, "Not Found")
+        old = {p: s for p, m, t, s in store.walk(store.commits[base_sha]["tree"]) if t == "blob"}
+        new = {p: s for p, m, t, s in store.walk(store.commits[head_sha]["tree"]) if t == "blob"}
+        files = [{"filename": p, "status": "added" if p not in old else "modified", "sha": s}
+                 for p, s in new.items() if old.get(p) != s]
+        files += [{"filename": p, "status": "removed", "sha": s} for p, s in old.items() if p not in new]
+        if base_sha == head_sha: status = "identical"
+        elif store.is_ancestor(base_sha, head_sha): status = "ahead"
+        elif store.is_ancestor(head_sha, base_sha): status = "behind"
+        else: status = "diverged"
+        self._json(200, {"url": self._url(f"/compare/{base}...{head}"), "status": status, "ahead_by": 0, "behind_by": 0,
+                         "total_commits": 0, "commits": [], "files": files[:300],
+                         "base_commit": self._commit_json(base_sha), "merge_base_commit": self._commit_json(base_sha)})
+
+    def get_contents(self, path):
+        store = self.server.store
+        commit = store.resolve_commit(self.query.get("ref", store.branch))
+        entry = store.lookup(store.commits[commit]["tree"], path) if commit else None
+        if entry is None: return self._error(404, "Not Found")
+        mode, kind, sha = entry
+        if kind == "tree":
+            return self._json(200, [self._content_json(f"{path}/{n}".lstrip("/"), m, t, s) for m, t, n, s in store.trees[sha]])
+        item = self._content_json(path, mode, kind, sha)
+        item.update(content=base64.b64encode(store.blobs[sha]).decode("ascii"), encoding="base64")
+        self._json(200, item)
+
+
+class FakeGitHubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, store, repo_name, latency=0.0):
+        super().__init__(address, FakeGitHubHandler)
+        self.store = store
+        self.repo_name = repo_name
+        self.latency = latency  # 요청마다 더하는 왕복 지연(초)
+        self.lock = threading.Lock()
+        self.counts = Counter()
+        self.remaining = 5000
+        self.base_url = f"http://{address[0]}:{self.server_address[1]}"
+
+    def total_requests(self):
+        with self.lock: return sum(self.counts.values())
+
+
+def start_fake_github(store, repo_name="bench/red-drive", host="127.0.0.1", port=0, latency=0.0):
+    # 백그라운드 스레드로 서버 시작 -> (server, base_url), server.store 를 바꿔 끼우면 다른 카탈로그로 전환
+    server = FakeGitHubServer((host, port), store, repo_name, latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.base_url
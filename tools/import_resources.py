@@ -0,0 +1,223 @@
+"""리소스 일괄 등록: 로컬 폴더의 하위 폴더를 리소스 1개씩으로 보고 AI 설명을 만든 뒤 몇 개의 커밋으로 묶어 올립니다.
+
+    apps-script/
+      회의록아카이빙/          -> 제목 = 폴더명, 폴더 바로 아래 파일만 등록 (숨김 파일 제외)
+        Code.gs
+        Index.html
+        appsscript.json
+        meta.json            -> 선택: {"title": ..., "category": ..., "hint": ...} 로 제목/카테고리/힌트 지정 (카테고리는 앱의 분류 중 하나)
+
+앱과 같은 설정(.streamlit/secrets.toml 의 저장소 백엔드, GitHub, OpenAI, cache_dir)을 쓰므로 app.py 가 있는 폴더에서 실행합니다.
+info.json 스키마와 폴더명(<제목>_<hex>), 설명 캐시는 관리자 화면의 신규 등록과 같습니다.
+
+    python tools/import_resources.py ~/apps-script --category Workflow --concurrency 4 --batch-size 50
+    python tools/import_resources.py ~/apps-script --dry-run
+
+진행 상황은 저널(기본: <원본 폴더>/.red-drive-import.jsonl)에 폴더별로 한 줄씩 남깁니다. 중단 후 같은 명령을 다시 실행하면
+등록이 끝난 폴더는 건너뛰고, 설명까지 만든 폴더는 다시 생성하지 않고 커밋부터 이어갑니다.
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(TOOLS_DIR)
+sys.path.insert(0, TOOLS_DIR)
+
+from memory_file import MemoryFile  # noqa: E402
+
+JOURNAL_NAME = ".red-drive-import.jsonl"
+META_NAME = "meta.json"
+SKIP_NAMES = {META_NAME, "Thumbs.db", "desktop.ini"}
+
+
+class Journal:
+    # 원본 폴더별 마지막 상태를 JSON 한 줄씩 덧붙임: described(설명 완료) -> imported(커밋 완료) / failed
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try: entry = json.loads(line)
+                    except ValueError: continue  # 중단되면서 잘린 마지막 줄
+                    self.entries[entry["source"]] = entry
+
+    def status(self, source):
+        return self.entries.get(source, {}).get("status")
+
+    def write(self, entry):
+        with self.lock:
+            self.entries[entry["source"]] = entry
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+
+def scan_sources(source_dir):
+    return sorted(n for n in os.listdir(source_dir) if not n.startswith(".") and os.path.isdir(os.path.join(source_dir, n)))
+
+
+def load_folder(folder, default_category):
+    # -> (제목, 카테고리, 힌트, [MemoryFile]) 하위 폴더는 앱 업로드와 같이 등록하지 않음
+    meta = {}
+    if os.path.exists(os.path.join(folder, META_NAME)):
+        with open(os.path.join(folder, META_NAME), encoding="utf-8") as f: meta = json.load(f)
+    files = []
+    for name in sorted(os.listdir(folder)):
+        path = os.path.join(folder, name)
+        if name.startswith(".") or name in SKIP_NAMES or not os.path.isfile(path): continue
+        with open(path, "rb") as f: files.append(MemoryFile(name, f.read()))
+    return meta.get("title") or os.path.basename(folder), meta.get("category") or default_category, meta.get("hint", ""), files
+
+
+def check_category(app, category):
+    # --category 와 meta.json 의 category 를 같은 기준(앱의 분류 목록)으로 검사
+    if category not in app.CATEGORIES: raise ValueError(f"카테고리는 {', '.join(app.CATEGORIES)} 중 하나여야 합니다 (받은 값: {category!r})")
+
+
+def describe(app, files, hint):
+    # 관리자 화면과 같은 입력/캐시 키로 설명 생성 (같은 파일 + 힌트면 설명 캐시 적중), 실패는 재시도 후 예외
+    file_items, cache_key = app.desc_inputs(files, hint)
+    return app.describe_files(file_items, hint, cache_key)
+
+
+def describe_source(app, args, source, previous):
+    title, category, hint, files = load_folder(os.path.join(args.source, source), args.category)
+    if not files: raise ValueError("등록할 파일이 없습니다")
+    check_category(app, category)  # meta.json 의 오타도 AI 설명을 만들기 전에 실패로 기록
+    # 폴더명은 처음 한 번만 정하고 저널에 남김 -> 재실행 시 같은 이름으로 커밋 (이미 올라간 폴더 판별에 사용)
+    return {"source": source, "status": "described", "folder": previous.get("folder") or app.new_folder_name(title),
+            "title": title, "category": category, "description": describe(app, files, hint)}
+
+
+def resource_meta(entry, files):
+    return {"title": entry["title"], "category": entry["category"], "description": entry["description"], "files": [f.name for f in files]}
+
+
+def commit_github_batch(app, batch):
+    # 📌 배치 전체를 트리 1개 + 커밋 1개로: blob 은 병렬 생성(저장소에 이미 있는 내용은 SHA 재사용), 매니페스트도 같은 커밋에서 갱신
+    # -> (커밋 SHA, 이미 저장소에 있던 폴더 목록: 직전 실행이 커밋 후 저널 기록 전에 중단된 경우)
+    from github import InputGitTreeElement, UnknownObjectException
+    repo = app.get_repo()
+    head_sha = app.get_head_sha(repo)
+    try:
+        existing = {e.path for e in app.gh(repo.get_git_tree, f"{head_sha}:{app.UPLOAD_DIR}").tree if e.type == "tree"}
+        known = set(app.known_blob_shas(head_sha))
+    except UnknownObjectException:
+        existing, known = set(), set()  # resources/ 가 아직 없음
+    already = [entry for entry, _ in batch if entry["folder"] in existing]
+    batch = [(entry, files) for entry, files in batch if entry["folder"] not in existing]
+    if not batch: return None, already
+
+    elements, to_upload, items = [], {}, {}
+    for entry, files in batch:
+        base_path = f"{app.UPLOAD_DIR}/{entry['folder']}"
+        meta = resource_meta(entry, files)
+        info = MemoryFile("info.json", json.dumps(meta, ensure_ascii=False, indent=4).encode("utf-8"))
+        for f in files + [info]:
+            sha = app.git_blob_sha(f)
+            elements.append(InputGitTreeElement(f"{base_path}/{f.name}", "100644", "blob", sha=sha))
+            if sha not in known:
+                known.add(sha)
+                to_upload[sha] = f
+        items[entry["folder"]] = app.manifest_item(app.resource_entry(entry["folder"], meta, app.git_blob_sha(info)))
+
+    def upload(f):
+        if f.size < app.LARGE_FILE_BYTES: return app.create_blob(repo, f.getvalue())
+        return app.stream_blob(f, f.size, lambda n: None)
+    with ThreadPoolExecutor(max_workers=app.GITHUB_WORKERS) as pool: list(pool.map(upload, to_upload.values()))
+
+    def build_tree(parent):
+        try: listing = app.gh(repo.get_git_tree, f"{parent.sha}:{app.UPLOAD_DIR}").tree
+        except UnknownObjectException: listing = []
+        content = app.updated_manifest(repo, listing, lambda m: m.update(items))
+        manifest = InputGitTreeElement(app.MANIFEST_PATH, "100644", "blob", content=content)
+        return app.gh(repo.create_git_tree, elements + [manifest], parent.tree)
+
+    commit = app.commit_tree_changes(repo, f"Import {len(batch)} resources", build_tree)
+    return commit.sha, already
+
+
+def commit_local_batch(app, batch):
+    # local 백엔드: 폴더별로 임시 폴더에 쓰고 교체 (미러링이 켜져 있으면 GitHub 반영은 미러 스레드가 묶어서 처리)
+    storage = app.get_storage()
+    already = [entry for entry, _ in batch if os.path.isdir(os.path.join(storage.base, entry["folder"]))]
+    for entry, files in batch:
+        if entry not in already: storage.upload(entry["folder"], files, resource_meta(entry, files))
+    return storage.catalog()[1], already
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 폴더의 리소스들을 설명 생성 + 일괄 커밋으로 등록")
+    parser.add_argument("source", help="리소스 폴더들이 들어 있는 폴더 (하위 폴더 1개 = 리소스 1개)")
+    parser.add_argument("--category", default="Workflow", help="meta.json 에 없을 때 쓸 카테고리")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 생성할 AI 설명 수")
+    parser.add_argument("--batch-size", type=int, default=50, help="커밋 1개에 담을 리소스 수")
+    parser.add_argument("--limit", type=int, help="이번 실행에서 처리할 최대 폴더 수")
+    parser.add_argument("--journal", help=f"진행 저널 경로 (기본: <source>/{JOURNAL_NAME})")
+    parser.add_argument("--dry-run", action="store_true", help="대상 폴더만 보여주고 종료")
+    args = parser.parse_args()
+    args.source = os.path.abspath(args.source)
+    journal = Journal(args.journal or os.path.join(args.source, JOURNAL_NAME))
+
+    sys.path.insert(0, REPO_ROOT)
+    import app  # 현재 폴더의 .streamlit/secrets.toml 을 읽음
+    try: check_category(app, args.category)
+    except ValueError as e: parser.error(f"--category: {e}")
+    if not app.OPENAI_API_KEY and not args.dry_run: parser.error("Secrets 에 openai_api_key 가 없습니다 (설명 없이 등록되는 것을 막기 위해 중단)")
+
+    sources = scan_sources(args.source)
+    remaining = [s for s in sources if journal.status(s) != "imported"]
+    pending = remaining[:args.limit]
+    print(f"폴더 {len(sources)}개 · 등록 완료 {len(sources) - len(remaining)}개 · 이번 처리 {len(pending)}개 (저장소: {app.STORAGE_BACKEND})", flush=True)
+    if args.dry_run:
+        for s in pending: print(f"  {s}  [{journal.status(s) or '신규'}]")
+        return
+
+    # 1) 설명 생성: 동시 실행 수 제한, 끝나는 대로 저널에 기록
+    todo = [s for s in pending if journal.status(s) != "described"]
+    pool = ThreadPoolExecutor(max_workers=args.concurrency, thread_name_prefix="import-desc")
+    try:
+        futures = {pool.submit(describe_source, app, args, s, journal.entries.get(s, {})): s for s in todo}
+        for done, future in enumerate(as_completed(futures), 1):
+            source = futures[future]
+            try:
+                entry = future.result()
+                print(f"  [{done}/{len(todo)}] 설명 완료  {source} -> {entry['folder']}", flush=True)
+            except Exception as e:
+                entry = dict(journal.entries.get(source, {}), source=source, status="failed", error=str(e))
+                print(f"  [{done}/{len(todo)}] 설명 실패  {source}: {e}", flush=True)
+            journal.write(entry)
+    except KeyboardInterrupt:
+        pool.shutdown(wait=False, cancel_futures=True)
+        print("\n중단됨: 같은 명령을 다시 실행하면 이어서 진행합니다.")
+        sys.exit(130)
+    pool.shutdown()
+
+    # 2) 배치 커밋: 설명이 끝난 폴더만 batch-size 개씩 커밋 1개로
+    ready = [journal.entries[s] for s in pending if journal.status(s) == "described"]
+    commit_batch = commit_local_batch if app.STORAGE_BACKEND == "local" else commit_github_batch
+    imported = 0
+    for start in range(0, len(ready), args.batch_size):
+        entries = ready[start:start + args.batch_size]
+        batch = [(entry, load_folder(os.path.join(args.source, entry["source"]), args.category)[3]) for entry in entries]
+        commit, already = commit_batch(app, batch)
+        for entry in entries:
+            journal.write(dict(entry, status="imported", commit=None if entry in already else commit))
+        imported += len(entries)
+        note = f" (이미 올라가 있던 {len(already)}개 포함)" if already else ""
+        print(f"  커밋 {commit[:12] if commit else '-'}: 리소스 {len(entries)}개{note} · 누적 {imported}/{len(ready)}", flush=True)
+
+    failed = [s for s in pending if journal.status(s) == "failed"]
+    print(f"\n등록 {imported}개 · 실패 {len(failed)}개" + (" (다시 실행하면 실패한 폴더만 재시도)" if failed else ""))
+    if failed: sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
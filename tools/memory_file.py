@@ -0,0 +1,16 @@
+"""도구 스크립트 공용 업로드 파일 객체.
+
+앱의 업로드 경로(upload / git_blob_sha / file_digest / read_desc_sample)는 st.file_uploader 가 돌려주는
+UploadedFile 을 받습니다. 벤치마크(bench.py)와 일괄 등록(import_resources.py)은 이 클래스로 같은 모양을 만들어 넘깁니다.
+
+    from memory_file import MemoryFile
+    files = [MemoryFile("Code.gs", data)]
+"""
+import io
+
+
+class MemoryFile(io.BytesIO):
+    # st.file_uploader 가 돌려주는 UploadedFile 과 같은 모양 (name / size / getvalue / read / seek)
+    def __init__(self, name, data):
+        super().__init__(data)
+        self.name, self.size = name, len(data)
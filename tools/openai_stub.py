@@ -0,0 +1,129 @@
+"""로컬 OpenAI 스텁 서버.
+
+chat.completions 요청에 미리 준비한 답변을 그대로 돌려줍니다. stream=true 요청이면
+SSE 청크로 나눠서 재생하므로, 실제 API 없이 스트리밍 미리보기와 첫 토큰 시간(TTFT)을 확인할 수 있습니다.
+
+    python tools/openai_stub.py --port 8089 --reply canned.md --ttft 0.8 --chunk-delay 0.03
+
+.streamlit/secrets.toml 의 [general] 에 아래처럼 지정하면 앱이 스텁을 사용합니다.
+
+    openai_base_url = "http://127.0.0.1:8089/v1"
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_REPLY = """### 📋 시스템 요약 (Executive Summary)
+로컬 스텁 서버가 재생한 예시 설명입니다. 실제 분석 결과가 아닙니다.
+
+### ⚙️ 아키텍처 및 데이터 흐름
+* **Flow**: `[업로드 파일] -> [스텁 응답] -> [미리보기]`
+
+### ✨ 비즈니스 임팩트
+실제 API 호출 없이 업로드/스트리밍 흐름을 점검할 수 있습니다.
+"""
+
+
+class StubState:
+    def __init__(self, reply=DEFAULT_REPLY, ttft=0.2, chunk_delay=0.02, chunk_chars=8, latency=None):
+        self.reply = reply
+        self.ttft = ttft  # 첫 청크 전 대기(초)
+        self.chunk_delay = chunk_delay  # 청크 사이 대기(초)
+        self.chunk_chars = chunk_chars
+        self.latency = ttft if latency is None else latency  # 비스트리밍 응답 대기(초)
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def chunks(self):
+        return [self.reply[i:i + self.chunk_chars] for i in range(0, len(self.reply), self.chunk_chars)]
+
+    def usage(self, prompt):
+        prompt_tokens = len(prompt.encode("utf-8")) // 3 + 1
+        completion_tokens = len(self.reply.encode("utf-8")) // 3 + 1
+        return {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens, "total_tokens": prompt_tokens + completion_tokens}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.0"  # 스트리밍 응답은 연결 종료로 끝을 알림
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _sse(self, payload):
+        data = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+        self.wfile.write(f"data: {data}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def do_POST(self):
+        state = self.server.state
+        with state.lock: state.requests += 1
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            return self._json(404, {"error": {"message": f"stub: unknown path {self.path}"}})
+        prompt = "".join(m.get("content", "") for m in body.get("messages", []))
+        model = body.get("model", "gpt-4o")
+        base = {"id": "chatcmpl-stub", "created": int(time.time()), "model": model}
+
+        if not body.get("stream"):
+            time.sleep(state.latency)
+            return self._json(200, dict(base, object="chat.completion", usage=state.usage(prompt), choices=[
+                {"index": 0, "message": {"role": "assistant", "content": state.reply}, "finish_reason": "stop"}]))
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        chunk = dict(base, object="chat.completion.chunk")
+        time.sleep(state.ttft)
+        self._sse(dict(chunk, choices=[{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}]))
+        for piece in state.chunks():
+            self._sse(dict(chunk, choices=[{"index": 0, "delta": {"content": piece}, "finish_reason": None}]))
+            time.sleep(state.chunk_delay)
+        self._sse(dict(chunk, choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}]))
+        if (body.get("stream_options") or {}).get("include_usage"):
+            self._sse(dict(chunk, choices=[], usage=state.usage(prompt)))
+        self._sse("[DONE]")
+
+
+def start_stub_server(state=None, host="127.0.0.1", port=0):
+    # 같은 프로세스 안에서 띄울 때 사용 (port=0 이면 빈 포트 자동 선택) -> (server, base_url)
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    server.state = state or StubState()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/v1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="chat.completions 응답을 재생하는 로컬 OpenAI 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--reply", help="재생할 답변(Markdown) 파일, 없으면 기본 예시")
+    parser.add_argument("--ttft", type=float, default=0.2, help="첫 청크까지 지연(초)")
+    parser.add_argument("--chunk-delay", type=float, default=0.02, help="청크 사이 지연(초)")
+    parser.add_argument("--chunk-chars", type=int, default=8, help="청크 1개당 글자 수")
+    args = parser.parse_args()
+
+    reply = DEFAULT_REPLY
+    if args.reply:
+        with open(args.reply, encoding="utf-8") as f: reply = f.read()
+    state = StubState(reply, args.ttft, args.chunk_delay, args.chunk_chars)
+    server = ThreadingHTTPServer((args.host, args.port), StubHandler)
+    server.daemon_threads = True
+    server.state = state
+    print(f"OpenAI stub: http://{args.host}:{args.port}/v1")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()